@@ -0,0 +1,30 @@
+"""
+Ahead-of-time compilation of the numeric kernels with numba.pycc
+Builds the extension module numdiff_kernels next to this file, so that
+section2/section3 can import ready machine code instead of JIT-compiling
+on the first call of every session.
+
+Usage (once, after installing numba):
+    python compile_kernels.py
+
+Without the compiled module the sections fall back to @njit (or plain
+Python when numba is not installed).
+"""
+
+import os
+
+from numba.pycc import CC
+
+from section2_equally_spaced import _difference_columns_nb
+from section3_unequally_spaced import _three_point_deriv
+
+cc = CC("numdiff_kernels")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Export the pure-Python bodies of the JIT kernels with fixed signatures
+cc.export("difference_columns", "void(f8[::1], i8, f8[::1])")(_difference_columns_nb.py_func)
+cc.export("three_point_deriv", "f8(f8, f8, f8, f8, f8, f8, f8)")(_three_point_deriv.py_func)
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"Compiled numdiff_kernels into {cc.output_dir}")
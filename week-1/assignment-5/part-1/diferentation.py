@@ -1,42 +1,117 @@
 import math
+from functools import lru_cache
+import numpy as np
+import sympy as sp
 
-def forward_difference_table(f_values, n):
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator used when numba is not installed"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Extrema record and its codes are shared with Section 4
+from section4_extrema_analysis import (
+    Extrema, MINIMUM, MAXIMUM, INFLECTION, CONCAVE_UP, CONCAVE_DOWN, UNKNOWN,
+    _TYPE_NAMES, _CONCAVITY_NAMES, _SECOND_TEST_MESSAGES, _EXPECTED_CONCAVITY
+)
+
+@njit(cache=True)
+def _difference_buffer_nb(f_values, n):
     """
-    Construct forward difference table for equally spaced data
-    Returns a 2D list where table[i][j] represents Δ^j f_i
+    Compiled kernel for the difference tables (f_values: float64 array)
+    Packs the triangle column by column into one buffer of n(n+1)/2 values:
+    column j (length n-j) starts at offset j*n - j*(j-1)/2 and holds Δ^j f_0 .. Δ^j f_{n-1-j}
     """
-    table = [[0 for _ in range(n)] for _ in range(n)]
+    buffer = np.empty(n * (n + 1) // 2)
     
     # First column is the function values
     for i in range(n):
-        table[i][0] = f_values[i]
+        buffer[i] = f_values[i]
     
-    # Compute forward differences
+    # Each column depends only on the previous one
+    prev = 0
+    offset = n
     for j in range(1, n):
         for i in range(n - j):
-            table[i][j] = table[i + 1][j - 1] - table[i][j - 1]
+            buffer[offset + i] = buffer[prev + i + 1] - buffer[prev + i]
+        prev = offset
+        offset += n - j
     
-    return table
+    return buffer
+
+@lru_cache(maxsize=8)
+def _cached_columns(f_bytes, n):
+    """Build the packed table once per (f values, n); the columns are read-only since they are shared"""
+    buffer = _difference_buffer_nb(np.frombuffer(f_bytes, dtype=np.float64), n)
+    buffer.flags.writeable = False
+    offsets = [j * n - j * (j - 1) // 2 for j in range(n + 1)]
+    return tuple(buffer[offsets[j]:offsets[j + 1]] for j in range(n))
+
+def forward_difference_table(f_values, n):
+    """
+    Construct forward difference table for equally spaced data
+    Returns a tuple of read-only float64 columns where table[j][i] represents Δ^j f_i
+    (column j has n-j entries)
+    """
+    f_bytes = np.ascontiguousarray(f_values, dtype=np.float64).tobytes()
+    return _cached_columns(f_bytes, n)
 
 def backward_difference_table(f_values, n):
     """
     Construct backward difference table for equally spaced data
-    Returns a 2D list where table[i][j] represents ∇^j f_i
+    Returns the same columns as forward_difference_table, since ∇^j f_i = Δ^j f_{i-j}:
+    table[j][i - j] represents ∇^j f_i (defined for i >= j)
     """
-    table = [[0 for _ in range(n)] for _ in range(n)]
-    
-    # First column is the function values
-    for i in range(n):
-        table[i][0] = f_values[i]
-    
-    # Compute backward differences
-    for j in range(1, n):
-        for i in range(j, n):
-            table[i][j] = table[i][j - 1] - table[i - 1][j - 1]
+    f_bytes = np.ascontiguousarray(f_values, dtype=np.float64).tobytes()
+    return _cached_columns(f_bytes, n)
+
+def step_coefficients(h):
+    """
+    Precompute the reciprocal step-size factors used by the Newton formulas
     
-    return table
+    Returns a tuple (1/h, 1/h²)
+    """
+    inv_h = 1.0 / np.float64(h)
+    return (inv_h, inv_h * inv_h)
+
+# Newton series coefficients: (first difference order used, coefficient of each term)
+#   forward  f'  ≈ (1/h)[Δf - (1/2)Δ²f + (1/3)Δ³f - (1/4)Δ⁴f]
+#   forward  f'' ≈ (1/h²)[Δ²f - Δ³f + (11/12)Δ⁴f]
+#   backward f'  ≈ (1/h)[∇f + (1/2)∇²f + (1/3)∇³f + (1/4)∇⁴f]
+#   backward f'' ≈ (1/h²)[∇²f + ∇³f + (11/12)∇⁴f]
+_NEWTON_SERIES = {
+    ("forward", 1): (1, (1.0, -1 / 2, 1 / 3, -1 / 4)),
+    ("forward", 2): (2, (1.0, -1.0, 11 / 12)),
+    ("backward", 1): (1, (1.0, 1 / 2, 1 / 3, 1 / 4)),
+    ("backward", 2): (2, (1.0, 1.0, 11 / 12)),
+}
+
+def _build_newton_kernel(direction, order, depth):
+    """Generate a straight-line kernel summing the series up to Δ^depth with folded coefficients"""
+    first, coefficients = _NEWTON_SERIES[(direction, order)]
+    args = [f"t{k}" for k in range(first, depth + 1)]
+    terms = " + ".join(f"{c!r} * {t}" for c, t in zip(coefficients, args))
+    name = f"_{direction}_o{order}_k{depth}"
+    source = f"def {name}({', '.join(args)}, scale):\n    return ({terms}) * scale\n"
+    namespace = {}
+    exec(compile(source, f"<{name}>", "exec"), namespace)
+    return namespace[name]
 
-def newton_forward_derivative(x_values, f_values, h, point_index=0, order=1):
+# _KERNELS[(direction, order, depth)] -> kernel(t_first, ..., t_depth, scale)
+_KERNELS = {
+    (direction, order, depth): _build_newton_kernel(direction, order, depth)
+    for (direction, order), (first, _) in _NEWTON_SERIES.items()
+    for depth in range(first, 5)
+}
+
+def newton_forward_derivative(x_values, f_values, h, point_index=0, order=1, coeffs=None):
     """
     Calculate derivative using Newton's forward difference formula
     
@@ -46,39 +121,26 @@ def newton_forward_derivative(x_values, f_values, h, point_index=0, order=1):
     - h: step size
     - point_index: index of point where derivative is needed (default: 0)
     - order: derivative order (1 or 2)
+    - coeffs: optional precomputed step_coefficients(h)
     
     Returns:
     - derivative value at specified point
     """
-    n = len(f_values)
-    table = forward_difference_table(f_values, n)
-    
-    if order == 1:
-        # First derivative: f'(x₀) ≈ (1/h)[Δf₀ - (1/2)Δ²f₀ + (1/3)Δ³f₀ - ...]
-        derivative = table[point_index][1] / h
-        
-        # Add higher order terms for better accuracy
-        if n > point_index + 2:
-            derivative -= table[point_index][2] / (2 * h)
-        if n > point_index + 3:
-            derivative += table[point_index][3] / (3 * h)
-        if n > point_index + 4:
-            derivative -= table[point_index][4] / (4 * h)
-            
-    elif order == 2:
-        # Second derivative: f''(x₀) ≈ (1/h²)[Δ²f₀ - Δ³f₀ + (11/12)Δ⁴f₀ - ...]
-        derivative = table[point_index][2] / (h ** 2)
-        
-        if n > point_index + 3:
-            derivative -= table[point_index][3] / (h ** 2)
-        if n > point_index + 4:
-            derivative += (11 * table[point_index][4]) / (12 * h ** 2)
-    else:
+    if order not in (1, 2):
         raise ValueError("Only first and second derivatives are supported")
     
-    return derivative
+    n = len(f_values)
+    table = forward_difference_table(f_values, n)
+    if coeffs is None:
+        coeffs = step_coefficients(h)
+    
+    # Use as many higher-order terms as the table provides below this point (up to Δ⁴)
+    depth = min(4, max(order, n - 1 - point_index))
+    terms = [table[k][point_index] if point_index + k < n else 0.0
+             for k in range(order, depth + 1)]
+    return _KERNELS[("forward", order, depth)](*terms, coeffs[order - 1])
 
-def newton_backward_derivative(x_values, f_values, h, point_index=None, order=1):
+def newton_backward_derivative(x_values, f_values, h, point_index=None, order=1, coeffs=None):
     """
     Calculate derivative using Newton's backward difference formula
     
@@ -88,39 +150,27 @@ def newton_backward_derivative(x_values, f_values, h, point_index=None, order=1)
     - h: step size
     - point_index: index of point where derivative is needed (default: last point)
     - order: derivative order (1 or 2)
+    - coeffs: optional precomputed step_coefficients(h)
     
     Returns:
     - derivative value at specified point
     """
+    if order not in (1, 2):
+        raise ValueError("Only first and second derivatives are supported")
+    
     n = len(f_values)
     if point_index is None:
         point_index = n - 1
     
     table = backward_difference_table(f_values, n)
-    
-    if order == 1:
-        # First derivative: f'(xₙ) ≈ (1/h)[∇fₙ + (1/2)∇²fₙ + (1/3)∇³fₙ + ...]
-        derivative = table[point_index][1] / h
-        
-        if point_index >= 2:
-            derivative += table[point_index][2] / (2 * h)
-        if point_index >= 3:
-            derivative += table[point_index][3] / (3 * h)
-        if point_index >= 4:
-            derivative += table[point_index][4] / (4 * h)
-            
-    elif order == 2:
-        # Second derivative: f''(xₙ) ≈ (1/h²)[∇²fₙ + ∇³fₙ + (11/12)∇⁴fₙ + ...]
-        derivative = table[point_index][2] / (h ** 2)
-        
-        if point_index >= 3:
-            derivative += table[point_index][3] / (h ** 2)
-        if point_index >= 4:
-            derivative += (11 * table[point_index][4]) / (12 * h ** 2)
-    else:
-        raise ValueError("Only first and second derivatives are supported")
-    
-    return derivative
+    if coeffs is None:
+        coeffs = step_coefficients(h)
+    
+    # Use as many higher-order terms as the table provides above this point (up to ∇⁴)
+    depth = min(4, max(order, point_index))
+    terms = [table[k][point_index - k] if point_index >= k else 0.0
+             for k in range(order, depth + 1)]
+    return _KERNELS[("backward", order, depth)](*terms, coeffs[order - 1])
 
 def central_difference(f_values, h, point_index, order=1):
     """
@@ -143,12 +193,49 @@ def central_difference(f_values, h, point_index, order=1):
     elif order == 2:
         # f''(xᵢ) ≈ (f(xᵢ₊₁) - 2f(xᵢ) + f(xᵢ₋₁)) / h²
         derivative = (f_values[point_index + 1] - 2 * f_values[point_index] + 
-                     f_values[point_index - 1]) / (h ** 2)
+                     f_values[point_index - 1]) / (h * h)
     else:
         raise ValueError("Only first and second derivatives are supported")
     
     return derivative
 
+def central_difference_all(f_values, h):
+    """
+    Calculate central difference derivatives at all interior points at once
+    
+    Parameters:
+    - f_values: list or array of function values
+    - h: step size
+    
+    Returns:
+    - (f_prime, f_double_prime) arrays of length n - 2, where element k
+      corresponds to point index k + 1
+    """
+    f = np.asarray(f_values, dtype=np.float64)
+    
+    # f'(xᵢ) ≈ (f(xᵢ₊₁) - f(xᵢ₋₁)) / (2h)
+    f_prime = (f[2:] - f[:-2]) / (2 * h)
+    # f''(xᵢ) ≈ (f(xᵢ₊₁) - 2f(xᵢ) + f(xᵢ₋₁)) / h²
+    f_double_prime = (f[2:] - 2 * f[1:-1] + f[:-2]) / (h * h)
+    
+    return f_prime, f_double_prime
+
+def _three_point_deriv(xa, xb, xc, fa, fb, fc, x_eval):
+    """
+    Derivative at x_eval of the Lagrange polynomial through three points
+    Works on scalars as well as on NumPy arrays (element-wise)
+    
+    f'(x) ≈ fa·(2x-xb-xc)/((xa-xb)(xa-xc)) + fb·(2x-xa-xc)/((xb-xa)(xb-xc))
+          + fc·(2x-xa-xb)/((xc-xa)(xc-xb))
+    """
+    d_ab = xa - xb
+    d_ac = xa - xc
+    d_bc = xb - xc
+    
+    return (fa * (2 * x_eval - xb - xc) / (d_ab * d_ac)
+            - fb * (2 * x_eval - xa - xc) / (d_ab * d_bc)
+            + fc * (2 * x_eval - xa - xb) / (d_ac * d_bc))
+
 def unequally_spaced_forward(x_values, f_values, point_index=0):
     """
     Calculate first derivative using forward difference for unequally spaced data
@@ -167,25 +254,10 @@ def unequally_spaced_forward(x_values, f_values, point_index=0):
     if point_index + 2 >= n:
         raise ValueError("Not enough points ahead for forward difference")
     
-    x0 = x_values[point_index]
-    x1 = x_values[point_index + 1]
-    x2 = x_values[point_index + 2]
-    
-    f0 = f_values[point_index]
-    f1 = f_values[point_index + 1]
-    f2 = f_values[point_index + 2]
-    
-    # Three-point forward difference formula for unequal spacing
-    # f'(x₀) ≈ f₀·[(2x₀-x₁-x₂)/((x₀-x₁)(x₀-x₂))] + f₁·[(2x₀-x₀-x₂)/((x₁-x₀)(x₁-x₂))] 
-    #        + f₂·[(2x₀-x₀-x₁)/((x₂-x₀)(x₂-x₁))]
-    
-    coeff0 = (2 * x0 - x1 - x2) / ((x0 - x1) * (x0 - x2))
-    coeff1 = (2 * x0 - x0 - x2) / ((x1 - x0) * (x1 - x2))
-    coeff2 = (2 * x0 - x0 - x1) / ((x2 - x0) * (x2 - x1))
-    
-    derivative = f0 * coeff0 + f1 * coeff1 + f2 * coeff2
-    
-    return derivative
+    i = point_index
+    return _three_point_deriv(x_values[i], x_values[i + 1], x_values[i + 2],
+                              f_values[i], f_values[i + 1], f_values[i + 2],
+                              x_values[i])
 
 def unequally_spaced_backward(x_values, f_values, point_index=None):
     """
@@ -207,22 +279,10 @@ def unequally_spaced_backward(x_values, f_values, point_index=None):
     if point_index < 2:
         raise ValueError("Not enough points behind for backward difference")
     
-    xn = x_values[point_index]
-    xn_1 = x_values[point_index - 1]
-    xn_2 = x_values[point_index - 2]
-    
-    fn = f_values[point_index]
-    fn_1 = f_values[point_index - 1]
-    fn_2 = f_values[point_index - 2]
-    
-    # Three-point backward difference formula for unequal spacing
-    coeffn = (2 * xn - xn_1 - xn_2) / ((xn - xn_1) * (xn - xn_2))
-    coeffn_1 = (2 * xn - xn - xn_2) / ((xn_1 - xn) * (xn_1 - xn_2))
-    coeffn_2 = (2 * xn - xn - xn_1) / ((xn_2 - xn) * (xn_2 - xn_1))
-    
-    derivative = fn * coeffn + fn_1 * coeffn_1 + fn_2 * coeffn_2
-    
-    return derivative
+    i = point_index
+    return _three_point_deriv(x_values[i - 2], x_values[i - 1], x_values[i],
+                              f_values[i - 2], f_values[i - 1], f_values[i],
+                              x_values[i])
 
 def unequally_spaced_central(x_values, f_values, point_index):
     """
@@ -242,22 +302,113 @@ def unequally_spaced_central(x_values, f_values, point_index):
     if point_index <= 0 or point_index >= n - 1:
         raise ValueError("Central difference requires interior points")
     
-    x_prev = x_values[point_index - 1]
-    x_curr = x_values[point_index]
-    x_next = x_values[point_index + 1]
+    i = point_index
+    return _three_point_deriv(x_values[i - 1], x_values[i], x_values[i + 1],
+                              f_values[i - 1], f_values[i], f_values[i + 1],
+                              x_values[i])
+
+def unequally_spaced_central_all(x_values, f_values):
+    """
+    Central-like first derivative at every interior point of unequally spaced data
     
-    f_prev = f_values[point_index - 1]
-    f_curr = f_values[point_index]
-    f_next = f_values[point_index + 1]
+    Returns an array of length n-2 where element i-1 is f'(x_i). The evaluation point
+    is the middle node, so the Lagrange weights reduce to:
+      w_prev = (x_i - x_{i+1}) / ((x_{i-1} - x_i)(x_{i-1} - x_{i+1}))
+      w_curr = (2x_i - x_{i-1} - x_{i+1}) / ((x_i - x_{i-1})(x_i - x_{i+1}))
+      w_next = (x_i - x_{i-1}) / ((x_{i+1} - x_{i-1})(x_{i+1} - x_i))
+    """
+    x = np.asarray(x_values, dtype=np.float64)
+    f = np.asarray(f_values, dtype=np.float64)
+    xp, xc, xn = x[:-2], x[1:-1], x[2:]
+    
+    w_prev = (xc - xn) / ((xp - xc) * (xp - xn))
+    w_curr = (2 * xc - xp - xn) / ((xc - xp) * (xc - xn))
+    w_next = (xc - xp) / ((xn - xp) * (xn - xc))
+    return f[:-2] * w_prev + f[1:-1] * w_curr + f[2:] * w_next
+
+@njit(parallel=True, cache=True)
+def _scan_equally_spaced(f_values, h):
+    """
+    Parallel scan of interior points for equally spaced data
+    Returns (types, f_prime, f_double_prime) arrays of length n where
+    types[i] is 1 for a local maximum, -1 for a local minimum, 0 otherwise
+    """
+    n = len(f_values)
+    types = np.zeros(n, dtype=np.int8)
+    f_prime = np.full(n, np.nan)
+    f_double_prime = np.full(n, np.nan)
+    two_h = 2 * h
+    h_squared = h * h
+    
+    for i in prange(1, n - 1):
+        if f_values[i] > f_values[i-1] and f_values[i] > f_values[i+1]:
+            types[i] = 1
+        elif f_values[i] < f_values[i-1] and f_values[i] < f_values[i+1]:
+            types[i] = -1
+        
+        # Central differences (same formulas as central_difference)
+        f_prime[i] = (f_values[i + 1] - f_values[i - 1]) / two_h
+        f_double_prime[i] = (f_values[i + 1] - 2 * f_values[i] + f_values[i - 1]) / h_squared
     
-    # Three-point formula using points before, at, and after
-    coeff_prev = (2 * x_curr - x_curr - x_next) / ((x_prev - x_curr) * (x_prev - x_next))
-    coeff_curr = (2 * x_curr - x_prev - x_next) / ((x_curr - x_prev) * (x_curr - x_next))
-    coeff_next = (2 * x_curr - x_prev - x_curr) / ((x_next - x_prev) * (x_next - x_curr))
+    return types, f_prime, f_double_prime
+
+@njit(parallel=True, cache=True)
+def _scan_unequal(x_values, f_values):
+    """
+    Parallel scan of interior points for unequally spaced data
+    Same output as _scan_equally_spaced
+    """
+    n = len(f_values)
+    types = np.zeros(n, dtype=np.int8)
+    f_prime = np.full(n, np.nan)
+    f_double_prime = np.full(n, np.nan)
     
-    derivative = f_prev * coeff_prev + f_curr * coeff_curr + f_next * coeff_next
+    for i in prange(1, n - 1):
+        if f_values[i] > f_values[i-1] and f_values[i] > f_values[i+1]:
+            types[i] = 1
+        elif f_values[i] < f_values[i-1] and f_values[i] < f_values[i+1]:
+            types[i] = -1
+        
+        # Three-point formula (same as unequally_spaced_central)
+        x_prev = x_values[i - 1]
+        x_curr = x_values[i]
+        x_next = x_values[i + 1]
+        coeff_prev = (2 * x_curr - x_curr - x_next) / ((x_prev - x_curr) * (x_prev - x_next))
+        coeff_curr = (2 * x_curr - x_prev - x_next) / ((x_curr - x_prev) * (x_curr - x_next))
+        coeff_next = (2 * x_curr - x_prev - x_curr) / ((x_next - x_prev) * (x_next - x_curr))
+        f_prime[i] = f_values[i - 1] * coeff_prev + f_values[i] * coeff_curr + f_values[i + 1] * coeff_next
+        
+        # Three-point second derivative for non-uniform steps
+        h_left = x_curr - x_prev
+        h_right = x_next - x_curr
+        f_double_prime[i] = (2 * (h_right * f_values[i - 1] - (h_left + h_right) * f_values[i] + h_left * f_values[i + 1])
+                             / (h_left * h_right * (h_left + h_right)))
     
-    return derivative
+    return types, f_prime, f_double_prime
+
+def _scan_numpy(x, f, h=None):
+    """
+    NumPy counterpart of the _scan_* kernels used when numba is not installed
+    Detects extrema with boolean masks and evaluates derivatives only at those indices
+    Returns (idx, is_max, f_prime, f_double_prime), all of length len(idx)
+    """
+    centre, left, right = f[1:-1], f[:-2], f[2:]
+    is_max_mask = (centre > left) & (centre > right)
+    is_min_mask = (centre < left) & (centre < right)
+    idx = np.flatnonzero(is_max_mask | is_min_mask) + 1
+    is_max = is_max_mask[idx - 1]
+    
+    f_prev, f_curr, f_next = f[idx - 1], f[idx], f[idx + 1]
+    if h is not None:
+        f_prime = (f_next - f_prev) / (2 * h)
+        f_double_prime = (f_next - 2 * f_curr + f_prev) / (h * h)
+    else:
+        x_prev, x_curr, x_next = x[idx - 1], x[idx], x[idx + 1]
+        f_prime = _three_point_deriv(x_prev, x_curr, x_next, f_prev, f_curr, f_next, x_curr)
+        h_left, h_right = x_curr - x_prev, x_next - x_curr
+        f_double_prime = (2 * (h_right * f_prev - (h_left + h_right) * f_curr + h_left * f_next)
+                          / (h_left * h_right * (h_left + h_right)))
+    return idx, is_max, f_prime, f_double_prime
 
 def find_extrema(x_values, f_values, h=None, is_equally_spaced=True):
     """
@@ -270,45 +421,33 @@ def find_extrema(x_values, f_values, h=None, is_equally_spaced=True):
     - is_equally_spaced: whether data points are equally spaced
     
     Returns:
-    - list of dictionaries containing extrema information
+    - Extrema record with one array entry per extremum
     """
-    n = len(f_values)
-    extrema = []
+    x = np.asarray(x_values, dtype=np.float64)
+    f = np.asarray(f_values, dtype=np.float64)
     
-    # Check interior points for potential extrema
-    for i in range(1, n - 1):
-        # Check if it's a local maximum or minimum
-        if f_values[i] > f_values[i-1] and f_values[i] > f_values[i+1]:
-            extrema_type = "Maximum"
-        elif f_values[i] < f_values[i-1] and f_values[i] < f_values[i+1]:
-            extrema_type = "Minimum"
-        else:
-            continue
-        
-        # Calculate first derivative at this point
-        if is_equally_spaced and h is not None:
-            f_prime = central_difference(f_values, h, i, order=1)
-            f_double_prime = central_difference(f_values, h, i, order=2)
-        else:
-            f_prime = unequally_spaced_central(x_values, f_values, i)
-            # For second derivative, use finite difference approximation
-            if i > 1 and i < n - 2:
-                h_left = x_values[i] - x_values[i-1]
-                h_right = x_values[i+1] - x_values[i]
-                f_double_prime = (f_values[i+1] - 2*f_values[i] + f_values[i-1]) / ((h_left + h_right) / 2)**2
-            else:
-                f_double_prime = None
-        
-        extrema.append({
-            'index': i,
-            'x': x_values[i],
-            'f(x)': f_values[i],
-            'type': extrema_type,
-            'f_prime': f_prime,
-            'f_double_prime': f_double_prime
-        })
+    step = float(h) if is_equally_spaced and h is not None else None
     
-    return extrema
+    if NUMBA_AVAILABLE:
+        # Scan all interior points at once in the compiled parallel kernels
+        if step is not None:
+            types, f_prime, f_double_prime = _scan_equally_spaced(f, step)
+        else:
+            types, f_prime, f_double_prime = _scan_unequal(x, f)
+        idx = np.flatnonzero(types)
+        is_max = types[idx] > 0
+        f_prime, f_double_prime = f_prime[idx], f_double_prime[idx]
+    else:
+        idx, is_max, f_prime, f_double_prime = _scan_numpy(x, f, step)
+    
+    return Extrema(
+        index=idx,
+        x=x[idx],
+        fx=f[idx],
+        type_code=np.where(is_max, MAXIMUM, MINIMUM).astype(np.int8),
+        fprime=f_prime,
+        fdouble=f_double_prime
+    )
 
 def first_derivative_test(extrema):
     """
@@ -319,22 +458,12 @@ def first_derivative_test(extrema):
     - If f'(x) changes from negative to positive, x is a local minimum
     
     Parameters:
-    - extrema: list of extrema dictionaries from find_extrema
+    - extrema: Extrema record from find_extrema
     
     Returns:
-    - Updated extrema list with first derivative test results
+    - The same record with is_critical set (True where f'(x) ≈ 0)
     """
-    for ext in extrema:
-        f_prime = ext['f_prime']
-        
-        # Classification based on first derivative
-        if abs(f_prime) < 1e-6:  # Close to zero
-            if ext['type'] == "Maximum":
-                ext['first_derivative_test'] = "Critical point (f'≈0), likely Maximum"
-            else:
-                ext['first_derivative_test'] = "Critical point (f'≈0), likely Minimum"
-        else:
-            ext['first_derivative_test'] = f"f' = {f_prime:.6f} (not exactly zero, approximate extremum)"
+    extrema.is_critical = np.abs(extrema.fprime) < 1e-6
     
     return extrema
 
@@ -348,26 +477,18 @@ def second_derivative_test(extrema):
     - If f''(x) = 0, the test is inconclusive
     
     Parameters:
-    - extrema: list of extrema dictionaries from find_extrema
+    - extrema: Extrema record from find_extrema
     
     Returns:
-    - Updated extrema list with second derivative test results
+    - The same record with concavity_code set to CONCAVE_UP, CONCAVE_DOWN,
+      INFLECTION or UNKNOWN (f'' not available)
     """
-    for ext in extrema:
-        f_double_prime = ext['f_double_prime']
-        
-        if f_double_prime is None:
-            ext['second_derivative_test'] = "Unable to compute (insufficient data)"
-            ext['concavity'] = "Unknown"
-        elif f_double_prime > 1e-6:
-            ext['second_derivative_test'] = f"f'' = {f_double_prime:.6f} > 0 → Local Minimum"
-            ext['concavity'] = "Concave up"
-        elif f_double_prime < -1e-6:
-            ext['second_derivative_test'] = f"f'' = {f_double_prime:.6f} < 0 → Local Maximum"
-            ext['concavity'] = "Concave down"
-        else:
-            ext['second_derivative_test'] = f"f'' ≈ 0 → Test inconclusive"
-            ext['concavity'] = "Inflection point"
+    fdouble = extrema.fdouble
+    extrema.concavity_code = np.select(
+        [np.isnan(fdouble), fdouble > 1e-6, fdouble < -1e-6],
+        [UNKNOWN, CONCAVE_UP, CONCAVE_DOWN],
+        default=INFLECTION
+    )
     
     return extrema
 
@@ -405,20 +526,23 @@ def analyze_extrema(x_values, f_values, h=None, is_equally_spaced=True):
     print("4.1 MAXIMA AND MINIMA OF TABULATED FUNCTION")
     print("="*70)
     
-    for i, ext in enumerate(extrema, 1):
-        print(f"\nExtremum #{i}:")
-        print(f"  Location: x = {ext['x']:.6f} (index {ext['index']})")
-        print(f"  Value: f(x) = {ext['f(x)']:.6f}")
-        print(f"  Type: {ext['type']}")
+    for k in range(len(extrema)):
+        print(f"\nExtremum #{k + 1}:")
+        print(f"  Location: x = {extrema.x[k]:.6f} (index {extrema.index[k]})")
+        print(f"  Value: f(x) = {extrema.fx[k]:.6f}")
+        print(f"  Type: {_TYPE_NAMES[extrema.type_code[k]]}")
     
     print("\n" + "="*70)
     print("4.2 FIRST DERIVATIVE TEST FOR MAXIMA AND MINIMA")
     print("="*70)
     print("\nTheory: At a local extremum, f'(x) = 0 (or very close to 0)")
     
-    for i, ext in enumerate(extrema, 1):
-        print(f"\nExtremum #{i} at x = {ext['x']:.6f}:")
-        print(f"  {ext['first_derivative_test']}")
+    for k in range(len(extrema)):
+        print(f"\nExtremum #{k + 1} at x = {extrema.x[k]:.6f}:")
+        if extrema.is_critical[k]:
+            print(f"  Critical point (f'≈0), likely {_TYPE_NAMES[extrema.type_code[k]]}")
+        else:
+            print(f"  f' = {extrema.fprime[k]:.6f} (not exactly zero, approximate extremum)")
     
     print("\n" + "="*70)
     print("4.3 SECOND DERIVATIVE TEST FOR MAXIMA AND MINIMA")
@@ -428,61 +552,56 @@ def analyze_extrema(x_values, f_values, h=None, is_equally_spaced=True):
     print("  • If f''(x) < 0 → Local Maximum (concave down)")
     print("  • If f''(x) = 0 → Test inconclusive")
     
-    for i, ext in enumerate(extrema, 1):
-        print(f"\nExtremum #{i} at x = {ext['x']:.6f}:")
-        print(f"  {ext['second_derivative_test']}")
-        print(f"  Concavity: {ext['concavity']}")
+    for k in range(len(extrema)):
+        code = extrema.concavity_code[k]
+        
+        print(f"\nExtremum #{k + 1} at x = {extrema.x[k]:.6f}:")
+        print(f"  {_SECOND_TEST_MESSAGES[code].format(extrema.fdouble[k])}")
+        print(f"  Concavity: {_CONCAVITY_NAMES[code]}")
         
         # Verify consistency
-        if ext['type'] == "Maximum" and ext['concavity'] == "Concave down":
-            print(f"  ✓ Verification: Confirmed as Maximum")
-        elif ext['type'] == "Minimum" and ext['concavity'] == "Concave up":
-            print(f"  ✓ Verification: Confirmed as Minimum")
-        elif ext['concavity'] != "Unknown" and ext['concavity'] != "Inflection point":
+        if code == _EXPECTED_CONCAVITY[extrema.type_code[k]]:
+            print(f"  ✓ Verification: Confirmed as {_TYPE_NAMES[extrema.type_code[k]]}")
+        elif code == CONCAVE_UP or code == CONCAVE_DOWN:
             print(f"  ⚠ Warning: Type mismatch - review data")
     
     print("\n" + "="*70)
     print("SUMMARY OF EXTREMA")
     print("="*70)
     
-    maxima = [ext for ext in extrema if ext['type'] == "Maximum"]
-    minima = [ext for ext in extrema if ext['type'] == "Minimum"]
+    is_max = extrema.type_code == MAXIMUM
     
-    if maxima:
+    if is_max.any():
         print("\nLocal Maxima:")
-        for ext in maxima:
-            print(f"  x = {ext['x']:.6f}, f(x) = {ext['f(x)']:.6f}")
+        for x, fx in zip(extrema.x[is_max], extrema.fx[is_max]):
+            print(f"  x = {x:.6f}, f(x) = {fx:.6f}")
     
-    if minima:
+    if not is_max.all():
         print("\nLocal Minima:")
-        for ext in minima:
-            print(f"  x = {ext['x']:.6f}, f(x) = {ext['f(x)']:.6f}")
+        for x, fx in zip(extrema.x[~is_max], extrema.fx[~is_max]):
+            print(f"  x = {x:.6f}, f(x) = {fx:.6f}")
 
 def print_difference_table(table, n, table_type="Forward"):
     """Print forward or backward difference table in formatted manner"""
-    print(f"\n{table_type} Difference Table:")
-    print("-" * (15 * (n + 1)))
+    rule = "-" * (15 * (n + 1))
+    symbol = "Δ" if table_type == "Forward" else "∇"
+    forward = table_type == "Forward"
     
     # Header
-    header = "i\tf(x)\t"
-    for j in range(1, n):
-        if table_type == "Forward":
-            header += f"Δ^{j}f\t"
-        else:
-            header += f"∇^{j}f\t"
-    print(header)
-    print("-" * (15 * (n + 1)))
+    header = "\t".join(["i", "f(x)"] + [f"{symbol}^{j}f" for j in range(1, n)]) + "\t"
     
-    # Data rows
+    # Data rows: only cells inside the triangle hold differences
+    rows = []
     for i in range(n):
-        row = f"{i}\t{table[i][0]:.4f}\t"
-        for j in range(1, n):
-            if table[i][j] != 0 or (table_type == "Forward" and i + j < n) or (table_type == "Backward" and i >= j):
-                row += f"{table[i][j]:.4f}\t"
-            else:
-                row += "-\t"
-        print(row)
-    print("-" * (15 * (n + 1)))
+        if forward:
+            values = [table[j][i] for j in range(1, n - i)]
+        else:
+            values = [table[j][i - j] for j in range(1, i + 1)]
+        cells = ([f"{i}", f"{table[0][i]:.4f}"] + [f"{v:.4f}" for v in values]
+                 + ["-"] * (n - 1 - len(values)))
+        rows.append("\t".join(cells) + "\t")
+    
+    print("\n".join([f"\n{table_type} Difference Table:", rule, header, rule] + rows + [rule]))
 
 def equal_spacing(x_values, f_values, h):
     """
@@ -503,6 +622,8 @@ def equal_spacing(x_values, f_values, h):
     backward_table = backward_difference_table(f_values, n)
     print_difference_table(backward_table, n, "Backward")
     
+    coeffs = step_coefficients(h)
+    
     print("\n" + "="*70)
     print("DERIVATIVE CALCULATIONS")
     print("="*70)
@@ -511,36 +632,31 @@ def equal_spacing(x_values, f_values, h):
     print("\n--- Newton's Forward Difference Method ---")
     for i in range(min(3, n - 2)):
         try:
-            f_prime = newton_forward_derivative(x_values, f_values, h, i, order=1)
+            f_prime = newton_forward_derivative(x_values, f_values, h, i, order=1, coeffs=coeffs)
             print(f"f'(x_{i}) at x = {x_values[i]:.4f}: {f_prime:.6f}")
             
             if n > i + 2:
-                f_double_prime = newton_forward_derivative(x_values, f_values, h, i, order=2)
+                f_double_prime = newton_forward_derivative(x_values, f_values, h, i, order=2, coeffs=coeffs)
                 print(f"f''(x_{i}) at x = {x_values[i]:.4f}: {f_double_prime:.6f}")
         except Exception as e:
             print(f"Error calculating at index {i}: {e}")
     
     # Central differences for interior points
     print("\n--- Central Difference Method (Interior Points) ---")
+    f_prime_all, f_double_prime_all = central_difference_all(f_values, h)
     for i in range(1, n - 1):
-        try:
-            f_prime = central_difference(f_values, h, i, order=1)
-            print(f"f'(x_{i}) at x = {x_values[i]:.4f}: {f_prime:.6f}")
-            
-            f_double_prime = central_difference(f_values, h, i, order=2)
-            print(f"f''(x_{i}) at x = {x_values[i]:.4f}: {f_double_prime:.6f}")
-        except Exception as e:
-            print(f"Error calculating at index {i}: {e}")
+        print(f"f'(x_{i}) at x = {x_values[i]:.4f}: {f_prime_all[i - 1]:.6f}")
+        print(f"f''(x_{i}) at x = {x_values[i]:.4f}: {f_double_prime_all[i - 1]:.6f}")
     
     # Backward differences at the end
     print("\n--- Newton's Backward Difference Method ---")
     for i in range(max(n - 3, 2), n):
         try:
-            f_prime = newton_backward_derivative(x_values, f_values, h, i, order=1)
+            f_prime = newton_backward_derivative(x_values, f_values, h, i, order=1, coeffs=coeffs)
             print(f"f'(x_{i}) at x = {x_values[i]:.4f}: {f_prime:.6f}")
             
             if i >= 2:
-                f_double_prime = newton_backward_derivative(x_values, f_values, h, i, order=2)
+                f_double_prime = newton_backward_derivative(x_values, f_values, h, i, order=2, coeffs=coeffs)
                 print(f"f''(x_{i}) at x = {x_values[i]:.4f}: {f_double_prime:.6f}")
         except Exception as e:
             print(f"Error calculating at index {i}: {e}")
@@ -557,9 +673,9 @@ def unequal_spacing(x_values, f_values):
     
     # Display spacing information
     print("\nSpacing between consecutive points:")
+    spacings = np.diff(np.asarray(x_values, dtype=np.float64))
     for i in range(n - 1):
-        spacing = x_values[i + 1] - x_values[i]
-        print(f"h_{i} = x_{i+1} - x_{i} = {spacing:.6f}")
+        print(f"h_{i} = x_{i+1} - x_{i} = {spacings[i]:.6f}")
     
     print("\n" + "="*70)
     print("DERIVATIVE CALCULATIONS")
@@ -576,12 +692,9 @@ def unequal_spacing(x_values, f_values):
     
     # Central-like differences for interior points
     print("\n--- Unequally Spaced Central-Like Difference (Interior Points) ---")
+    f_prime_all = unequally_spaced_central_all(x_values, f_values)
     for i in range(1, n - 1):
-        try:
-            f_prime = unequally_spaced_central(x_values, f_values, i)
-            print(f"f'(x_{i}) at x = {x_values[i]:.4f}: {f_prime:.6f}")
-        except Exception as e:
-            print(f"Error at index {i}: {e}")
+        print(f"f'(x_{i}) at x = {x_values[i]:.4f}: {f_prime_all[i - 1]:.6f}")
     
     # Backward differences
     print("\n--- Unequally Spaced Backward Difference ---")
@@ -592,6 +705,41 @@ def unequal_spacing(x_values, f_values):
         except Exception as e:
             print(f"Error at index {i}: {e}")
 
+_X = sp.Symbol("x")
+_SYMPY_NAMES = {
+    "x": _X,
+    "sin": sp.sin,
+    "cos": sp.cos,
+    "tan": sp.tan,
+    "log": sp.log,
+    "exp": sp.exp,
+    "sqrt": sp.sqrt,
+    "e": sp.E,
+    "pi": sp.pi
+}
+
+def evaluate_vectorized(f, code, x_arr):
+    """
+    Evaluate f over all x values in one NumPy pass via sympy.lambdify
+    
+    Returns a float64 array, or None when the expression uses names outside the
+    supported set, cannot be converted, or produces non-finite values. The caller
+    then falls back to per-point evaluation, which reports the exact error.
+    """
+    if not set(code.co_names) <= _SYMPY_NAMES.keys():
+        return None
+    try:
+        expr = sp.sympify(f, locals=_SYMPY_NAMES, convert_xor=False)
+        func = sp.lambdify(_X, expr, "numpy")
+        with np.errstate(all="ignore"):
+            values = np.asarray(func(x_arr), dtype=np.float64)
+    except Exception:
+        return None
+    values = np.broadcast_to(values, x_arr.shape)
+    if not np.all(np.isfinite(values)):
+        return None
+    return values.copy()
+
 def main():
     """
     Main function integrating with your existing code structure
@@ -603,6 +751,7 @@ def main():
     # Input x values
     x_input = input("\nEnter x values separated by spaces: ")
     x_values = [float(val) for val in x_input.split()]
+    x_arr = np.asarray(x_values, dtype=np.float64)
     n = len(x_values)
     
     if n < 3:
@@ -638,14 +787,22 @@ def main():
             return
     else:
         # Compute f(x) values from function
-        f_values = []
-        for x in x_values:
-            tool["x"] = x
-            try:
-                f_values.append(eval(f, {"__builtins__": None}, tool))
-            except Exception as e:
-                print(f"Error evaluating function at x={x}: {e}")
-                return
+        try:
+            code = compile(f, "<user>", "eval")
+        except SyntaxError as e:
+            print(f"Error parsing function: {e}")
+            return
+        
+        f_values = evaluate_vectorized(f, code, x_arr)
+        if f_values is None:
+            f_values = []
+            for x in x_values:
+                tool["x"] = x
+                try:
+                    f_values.append(eval(code, {"__builtins__": None}, tool))
+                except Exception as e:
+                    print(f"Error evaluating function at x={x}: {e}")
+                    return
     
     # Display data table
     print("\n" + "="*70)
@@ -658,25 +815,20 @@ def main():
     print("="*70)
     
     # Check if spacing is equal
-    h = x_values[1] - x_values[0]
-    is_equally_spaced = True
-    
-    for i in range(n - 1):
-        current_spacing = x_values[i + 1] - x_values[i]
-        if not math.isclose(h, current_spacing, rel_tol=1e-7):
-            is_equally_spaced = False
-            break
+    diffs = np.diff(x_arr)
+    h = float(diffs[0])
+    is_equally_spaced = bool(np.allclose(diffs, h, rtol=1e-7, atol=0.0))
     
     # Process based on spacing type
     if is_equally_spaced:
         print(f"\n✓ Data points are EQUALLY SPACED with h = {h:.6f}")
-        equal_spacing(x_values, f_values, h)
+        equal_spacing(x_arr, f_values, h)
     else:
         print("\n✓ Data points are UNEQUALLY SPACED")
-        unequal_spacing(x_values, f_values)
+        unequal_spacing(x_arr, f_values)
     
     # Analyze extrema (Section 4)
-    analyze_extrema(x_values, f_values, h if is_equally_spaced else None, is_equally_spaced)
+    analyze_extrema(x_arr, f_values, h if is_equally_spaced else None, is_equally_spaced)
     
     print("\n" + "="*70)
     print("ANALYSIS COMPLETE")
@@ -3,7 +3,11 @@ Examples for testing Numerical Differentiation
 Quick test cases for all sections
 """
 
-import math
+import argparse
+import cProfile
+import pstats
+
+import numpy as np
 from section2_equally_spaced import run_section2
 from section3_unequally_spaced import run_section3
 from section4_extrema_analysis import run_section4
@@ -19,15 +23,15 @@ def example1_equally_spaced():
     print("="*70)
     
     x_values = [0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0]
-    f_values = [x**2 for x in x_values]
+    f_values = np.asarray(x_values, dtype=np.float64) ** 2
     h = 0.5
     
     print(f"\nData points: {len(x_values)}")
     print(f"Range: [{x_values[0]}, {x_values[-1]}]")
     print(f"Step size h = {h}")
     
-    run_section2(x_values, f_values, h)
-    run_section4(x_values, f_values, h, is_equally_spaced=True)
+    derivs = run_section2(x_values, f_values, h, return_derivs=True)
+    run_section4(x_values, f_values, h, is_equally_spaced=True, precomputed=derivs)
 
 def example2_equally_spaced_sine():
     """
@@ -40,16 +44,16 @@ def example2_equally_spaced_sine():
     print("EXAMPLE 2: EQUALLY SPACED - SINE FUNCTION f(x) = sin(x)")
     print("="*70)
     
-    x_values = [i * 0.3 for i in range(11)]  # 0 to 3.0 with h=0.3
-    f_values = [math.sin(x) for x in x_values]
+    x_values = np.arange(11) * 0.3  # 0 to 3.0 with h=0.3
+    f_values = np.sin(x_values)
     h = 0.3
     
     print(f"\nData points: {len(x_values)}")
     print(f"Range: [{x_values[0]:.2f}, {x_values[-1]:.2f}]")
     print(f"Step size h = {h}")
     
-    run_section2(x_values, f_values, h)
-    run_section4(x_values, f_values, h, is_equally_spaced=True)
+    derivs = run_section2(x_values, f_values, h, return_derivs=True)
+    run_section4(x_values, f_values, h, is_equally_spaced=True, precomputed=derivs)
 
 def example3_unequally_spaced():
     """
@@ -62,7 +66,7 @@ def example3_unequally_spaced():
     print("="*70)
     
     x_values = [0, 0.2, 0.5, 1.0, 1.7, 2.1, 2.8]
-    f_values = [math.exp(x) for x in x_values]
+    f_values = np.exp(np.asarray(x_values, dtype=np.float64))
     
     print(f"\nData points: {len(x_values)}")
     print(f"Range: [{x_values[0]}, {x_values[-1]}]")
@@ -83,15 +87,16 @@ def example4_parabola_with_extremum():
     print("Expected: Maximum at x = 2, f(2) = 4")
     
     x_values = [0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0]
-    f_values = [-(x-2)**2 + 4 for x in x_values]
+    x = np.asarray(x_values, dtype=np.float64)
+    f_values = -(x - 2)**2 + 4
     h = 0.5
     
     print(f"\nData points: {len(x_values)}")
     print(f"Range: [{x_values[0]}, {x_values[-1]}]")
     print(f"Step size h = {h}")
     
-    run_section2(x_values, f_values, h)
-    run_section4(x_values, f_values, h, is_equally_spaced=True)
+    derivs = run_section2(x_values, f_values, h, return_derivs=True)
+    run_section4(x_values, f_values, h, is_equally_spaced=True, precomputed=derivs)
 
 def example5_cubic_multiple_extrema():
     """
@@ -105,15 +110,16 @@ def example5_cubic_multiple_extrema():
     print("Expected: Maximum near x = 0, Minimum near x = 2")
     
     x_values = [-1, -0.5, 0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0]
-    f_values = [x**3 - 3*x**2 + 2 for x in x_values]
+    x = np.asarray(x_values, dtype=np.float64)
+    f_values = x**3 - 3*x**2 + 2
     h = 0.5
     
     print(f"\nData points: {len(x_values)}")
     print(f"Range: [{x_values[0]}, {x_values[-1]}]")
     print(f"Step size h = {h}")
     
-    run_section2(x_values, f_values, h)
-    run_section4(x_values, f_values, h, is_equally_spaced=True)
+    derivs = run_section2(x_values, f_values, h, return_derivs=True)
+    run_section4(x_values, f_values, h, is_equally_spaced=True, precomputed=derivs)
 
 def example6_unequally_with_extremum():
     """
@@ -126,7 +132,7 @@ def example6_unequally_with_extremum():
     print("="*70)
     
     x_values = [0, 0.3, 0.8, 1.2, 1.8, 2.4, 3.0]
-    f_values = [math.cos(x) for x in x_values]
+    f_values = np.cos(np.asarray(x_values, dtype=np.float64))
     
     print(f"\nData points: {len(x_values)}")
     print(f"Range: [{x_values[0]}, {x_values[-1]}]")
@@ -135,8 +141,8 @@ def example6_unequally_with_extremum():
     run_section3(x_values, f_values)
     run_section4(x_values, f_values, h=None, is_equally_spaced=False)
 
-def run_all_examples():
-    """Run all examples sequentially"""
+def run_all_examples(batch=False):
+    """Run all examples sequentially (batch=True skips the pause between examples)"""
     examples = [
         ("Example 1: Equally Spaced Quadratic", example1_equally_spaced),
         ("Example 2: Equally Spaced Sine", example2_equally_spaced_sine),
@@ -160,14 +166,14 @@ def run_all_examples():
         except Exception as e:
             print(f"\n❌ Error in {name}: {e}")
         
-        if i < len(examples):
+        if i < len(examples) and not batch:
             input("\nPress Enter to continue to next example...")
     
     print("\n" + "="*70)
     print("ALL EXAMPLES COMPLETED")
     print("="*70)
 
-def main():
+def main(batch=False):
     """Main menu for examples"""
     while True:
         print("\n" + "="*70)
@@ -198,7 +204,7 @@ def main():
         elif choice == '6':
             example6_unequally_with_extremum()
         elif choice == '7':
-            run_all_examples()
+            run_all_examples(batch)
         elif choice == '8':
             print("\n" + "="*70)
             print("Thank you!")
@@ -207,5 +213,22 @@ def main():
         else:
             print("\n❌ Invalid choice. Please enter 1-8.")
 
+def parse_args():
+    """Command line options for non-interactive and profiled runs"""
+    parser = argparse.ArgumentParser(description="Numerical differentiation examples")
+    parser.add_argument("--batch", action="store_true",
+                        help="run all examples without the menu and pauses")
+    parser.add_argument("--profile", action="store_true",
+                        help="run under cProfile and print the top functions by cumulative time")
+    return parser.parse_args()
+
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    entry = (lambda: run_all_examples(batch=True)) if args.batch else main
+    
+    if args.profile:
+        profiler = cProfile.Profile()
+        profiler.runcall(entry)
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(20)
+    else:
+        entry()
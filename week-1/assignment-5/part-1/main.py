@@ -10,10 +10,13 @@ import math
 import sys
 import os
 
+import numpy as np
+
 # Import section modules
 from section2_equally_spaced import run_section2
 from section3_unequally_spaced import run_section3
 from section4_extrema_analysis import run_section4
+from diferentation import evaluate_vectorized
 
 def display_menu():
     """Display main menu"""
@@ -71,24 +74,26 @@ def get_input_data():
             return None, None, None
     else:
         # Compute f(x) values from function
-        f_values = []
-        for x in x_values:
-            tool["x"] = x
-            try:
-                f_values.append(eval(f, {"__builtins__": None}, tool))
-            except Exception as e:
-                print(f"Error evaluating function at x={x}: {e}")
-                return None, None, None
+        try:
+            f_values = evaluate_vectorized(f, compile(f, "<function>", "eval"),
+                                           np.asarray(x_values, dtype=np.float64))
+        except SyntaxError:
+            f_values = None  # Reported by the per-point loop below
+        if f_values is not None:
+            f_values = f_values.tolist()
+        else:
+            f_values = []
+            for x in x_values:
+                tool["x"] = x
+                try:
+                    f_values.append(eval(f, {"__builtins__": None}, tool))
+                except Exception as e:
+                    print(f"Error evaluating function at x={x}: {e}")
+                    return None, None, None
     
     # Check if spacing is equal
-    h = x_values[1] - x_values[0]
-    is_equally_spaced = True
-    
-    for i in range(n - 1):
-        current_spacing = x_values[i + 1] - x_values[i]
-        if not math.isclose(h, current_spacing, rel_tol=1e-7):
-            is_equally_spaced = False
-            break
+    spacings = np.diff(np.asarray(x_values, dtype=np.float64))
+    is_equally_spaced = bool(np.allclose(spacings, spacings[0], rtol=1e-7, atol=0.0))
     
     return x_values, f_values, is_equally_spaced
 
@@ -114,13 +119,15 @@ def run_all_sections(x_values, f_values, is_equally_spaced):
     
     if is_equally_spaced:
         print(f"\n✓ Data points are EQUALLY SPACED with h = {h:.6f}")
-        run_section2(x_values, f_values, h)
+        derivs = run_section2(x_values, f_values, h, return_derivs=True)
     else:
         print("\n✓ Data points are UNEQUALLY SPACED")
         run_section3(x_values, f_values)
+        derivs = None
     
-    # Always run extrema analysis
-    run_section4(x_values, f_values, h if is_equally_spaced else None, is_equally_spaced)
+    # Always run extrema analysis (reusing the Section 2 central differences)
+    run_section4(x_values, f_values, h if is_equally_spaced else None, is_equally_spaced,
+                 precomputed=derivs)
 
 def main():
     """Main program loop"""
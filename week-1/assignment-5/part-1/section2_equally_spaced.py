@@ -4,43 +4,147 @@ Section 2: Derivatives using equally spaced values of argument
 - 2.2 Numerical differentiation using Newton's backward difference formula
 """
 
-def forward_difference_table(f_values, n):
+import sys
+import threading
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator used when numba is not installed"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+@njit("void(float64[::1], int64, float64[::1])", cache=True)
+def _difference_columns_nb(f, n, out):
     """
-    Construct forward difference table for equally spaced data
-    Returns a 2D list where table[i][j] represents Δ^j f_i
+    Compiled kernel filling out (length n(n+1)/2) with the difference columns packed
+    back to back: column j starts at j*n - j*(j-1)/2 and holds n - j values
     """
-    table = [[0 for _ in range(n)] for _ in range(n)]
-    
-    # First column is the function values
     for i in range(n):
-        table[i][0] = f_values[i]
+        out[i] = f[i]
     
-    # Compute forward differences
+    prev = 0
+    offset = n
     for j in range(1, n):
         for i in range(n - j):
-            table[i][j] = table[i + 1][j - 1] - table[i][j - 1]
+            out[offset + i] = out[prev + i + 1] - out[prev + i]
+        prev = offset
+        offset += n - j
+
+# Prefer the ahead-of-time compiled kernel (built by compile_kernels.py): no JIT warmup
+try:
+    from numdiff_kernels import difference_columns as _difference_columns_serial
+    AOT_AVAILABLE = True
+except ImportError:
+    _difference_columns_serial = _difference_columns_nb
+    AOT_AVAILABLE = False
+
+# No explicit signature: unlike the serial builder it is only needed for long
+# tabulations, so it compiles lazily on first use instead of on every cold import
+@njit(parallel=True, cache=True)
+def _difference_columns_par(f, n, out):
+    """
+    Parallel version of _difference_columns_nb for long tabulations: each column
+    depends on the previous one, but its entries are independent and split across cores
+    """
+    for i in prange(n):
+        out[i] = f[i]
+    
+    prev = 0
+    offset = n
+    for j in range(1, n):
+        for i in prange(n - j):
+            out[offset + i] = out[prev + i + 1] - out[prev + i]
+        prev = offset
+        offset += n - j
+
+# Below this many points thread dispatch costs more than the parallel loop saves
+PARALLEL_THRESHOLD = 64
+
+def table_size(n):
+    """Number of float64 values needed to hold a packed difference table for n points"""
+    return n * (n + 1) // 2
+
+_scratch = threading.local()
+
+def _scratch_buffer(size):
+    """
+    Per-thread reusable buffer of at least `size` values (grown when too small)
+    Tables built in it are only valid until the next build on the same thread
+    """
+    buffer = getattr(_scratch, "buffer", None)
+    if buffer is None or len(buffer) < size:
+        buffer = np.empty(max(size, table_size(64)))
+        _scratch.buffer = buffer
+    return buffer[:size]
+
+def _difference_columns(f_values, n, out=None):
+    """
+    Return the list of difference columns: column j holds Δ^j f_0 .. Δ^j f_(n-1-j)
+    The columns are views into `out` (at least table_size(n) values), allocated if None
+    """
+    f = np.ascontiguousarray(f_values[:n], dtype=np.float64)
+    size = table_size(n)
+    if out is None:
+        out = np.empty(size)
+    elif len(out) < size:
+        raise ValueError(f"out must hold at least {size} values for n = {n}")
+    
+    offsets = [j * n - j * (j - 1) // 2 for j in range(n + 1)]
+    table = [out[offsets[j]:offsets[j + 1]] for j in range(n)]
     
+    if NUMBA_AVAILABLE and n >= PARALLEL_THRESHOLD:
+        _difference_columns_par(f, n, out)
+    elif NUMBA_AVAILABLE or AOT_AVAILABLE:
+        _difference_columns_serial(f, n, out)
+    else:
+        # Each column is the difference of the previous one, written in place
+        table[0][:] = f
+        for j in range(1, n):
+            np.subtract(table[j - 1][1:], table[j - 1][:-1], out=table[j])
     return table
 
-def backward_difference_table(f_values, n):
+def forward_difference_table(f_values, n, out=None):
+    """
+    Construct forward difference table for equally spaced data
+    Returns a list of NumPy columns where table[j][i] represents Δ^j f_i
+    (column j has n - j entries; the columns are views into `out` when it is given)
+    """
+    return _difference_columns(f_values, n, out)
+
+def backward_difference_table(f_values, n, out=None):
     """
     Construct backward difference table for equally spaced data
-    Returns a 2D list where table[i][j] represents ∇^j f_i
+    Returns a list of NumPy columns where table[j][i - j] represents ∇^j f_i
+    (defined for i >= j; ∇^j f_i = Δ^j f_(i-j), so the columns are the same as the forward table)
     """
-    table = [[0 for _ in range(n)] for _ in range(n)]
-    
-    # First column is the function values
-    for i in range(n):
-        table[i][0] = f_values[i]
+    return _difference_columns(f_values, n, out)
+
+def step_reciprocals(h):
+    """
+    Reciprocal step-size factors shared by the Section 2 formulas
     
-    # Compute backward differences
-    for j in range(1, n):
-        for i in range(j, n):
-            table[i][j] = table[i][j - 1] - table[i - 1][j - 1]
+    Returns:
+    - (1/h, 1/(2h), 1/h², 11/(12h²))
     
-    return table
+    Raises:
+    - ValueError if h is zero
+    """
+    if h == 0:
+        raise ValueError("Step size h must be non-zero")
+    inv_h = 1.0 / np.float64(h)
+    inv_h2 = inv_h * inv_h
+    return inv_h, 0.5 * inv_h, inv_h2, 11 * inv_h2 / 12
 
-def newton_forward_derivative(x_values, f_values, h, point_index=0, order=1):
+def newton_forward_derivative(x_values, f_values, h, point_index=0, order=1, table=None, recips=None):
     """
     2.1: Calculate derivative using Newton's forward difference formula
     
@@ -50,39 +154,45 @@ def newton_forward_derivative(x_values, f_values, h, point_index=0, order=1):
     - h: step size
     - point_index: index of point where derivative is needed (default: 0)
     - order: derivative order (1 or 2)
+    - table: precomputed difference table (built from f_values if None)
+    - recips: precomputed step_reciprocals(h) (computed if None)
     
     Returns:
     - derivative value at specified point
     """
     n = len(f_values)
-    table = forward_difference_table(f_values, n)
+    if table is None:
+        table = forward_difference_table(f_values, n)
+    if recips is None:
+        recips = step_reciprocals(h)
+    inv_h, inv_2h, inv_h2, coef_h2_12 = recips
     
     if order == 1:
         # First derivative: f'(x₀) ≈ (1/h)[Δf₀ - (1/2)Δ²f₀ + (1/3)Δ³f₀ - ...]
-        derivative = table[point_index][1] / h
+        derivative = (table[1][point_index] if n > point_index + 1 else 0.0) * inv_h
         
         # Add higher order terms for better accuracy
         if n > point_index + 2:
-            derivative -= table[point_index][2] / (2 * h)
+            derivative -= table[2][point_index] * inv_2h
         if n > point_index + 3:
-            derivative += table[point_index][3] / (3 * h)
+            derivative += table[3][point_index] * inv_h / 3
         if n > point_index + 4:
-            derivative -= table[point_index][4] / (4 * h)
+            derivative -= table[4][point_index] * 0.25 * inv_h
             
     elif order == 2:
         # Second derivative: f''(x₀) ≈ (1/h²)[Δ²f₀ - Δ³f₀ + (11/12)Δ⁴f₀ - ...]
-        derivative = table[point_index][2] / (h ** 2)
+        derivative = (table[2][point_index] if n > point_index + 2 else 0.0) * inv_h2
         
         if n > point_index + 3:
-            derivative -= table[point_index][3] / (h ** 2)
+            derivative -= table[3][point_index] * inv_h2
         if n > point_index + 4:
-            derivative += (11 * table[point_index][4]) / (12 * h ** 2)
+            derivative += table[4][point_index] * coef_h2_12
     else:
         raise ValueError("Only first and second derivatives are supported")
     
     return derivative
 
-def newton_backward_derivative(x_values, f_values, h, point_index=None, order=1):
+def newton_backward_derivative(x_values, f_values, h, point_index=None, order=1, table=None, recips=None):
     """
     2.2: Calculate derivative using Newton's backward difference formula
     
@@ -92,6 +202,8 @@ def newton_backward_derivative(x_values, f_values, h, point_index=None, order=1)
     - h: step size
     - point_index: index of point where derivative is needed (default: last point)
     - order: derivative order (1 or 2)
+    - table: precomputed difference table (built from f_values if None)
+    - recips: precomputed step_reciprocals(h) (computed if None)
     
     Returns:
     - derivative value at specified point
@@ -100,33 +212,37 @@ def newton_backward_derivative(x_values, f_values, h, point_index=None, order=1)
     if point_index is None:
         point_index = n - 1
     
-    table = backward_difference_table(f_values, n)
+    if table is None:
+        table = backward_difference_table(f_values, n)
+    if recips is None:
+        recips = step_reciprocals(h)
+    inv_h, inv_2h, inv_h2, coef_h2_12 = recips
     
     if order == 1:
         # First derivative: f'(xₙ) ≈ (1/h)[∇fₙ + (1/2)∇²fₙ + (1/3)∇³fₙ + ...]
-        derivative = table[point_index][1] / h
+        derivative = (table[1][point_index - 1] if point_index >= 1 else 0.0) * inv_h
         
         if point_index >= 2:
-            derivative += table[point_index][2] / (2 * h)
+            derivative += table[2][point_index - 2] * inv_2h
         if point_index >= 3:
-            derivative += table[point_index][3] / (3 * h)
+            derivative += table[3][point_index - 3] * inv_h / 3
         if point_index >= 4:
-            derivative += table[point_index][4] / (4 * h)
+            derivative += table[4][point_index - 4] * 0.25 * inv_h
             
     elif order == 2:
         # Second derivative: f''(xₙ) ≈ (1/h²)[∇²fₙ + ∇³fₙ + (11/12)∇⁴fₙ + ...]
-        derivative = table[point_index][2] / (h ** 2)
+        derivative = (table[2][point_index - 2] if point_index >= 2 else 0.0) * inv_h2
         
         if point_index >= 3:
-            derivative += table[point_index][3] / (h ** 2)
+            derivative += table[3][point_index - 3] * inv_h2
         if point_index >= 4:
-            derivative += (11 * table[point_index][4]) / (12 * h ** 2)
+            derivative += table[4][point_index - 4] * coef_h2_12
     else:
         raise ValueError("Only first and second derivatives are supported")
     
     return derivative
 
-def central_difference(f_values, h, point_index, order=1):
+def central_difference(f_values, h, point_index, order=1, recips=None):
     """
     Calculate derivative using central difference formula
     (Used for interior points in equally spaced data)
@@ -136,28 +252,49 @@ def central_difference(f_values, h, point_index, order=1):
     - h: step size
     - point_index: index of point where derivative is needed
     - order: derivative order (1 or 2)
+    - recips: precomputed step_reciprocals(h) (computed if None)
     """
     n = len(f_values)
     
     if point_index <= 0 or point_index >= n - 1:
         raise ValueError("Central difference requires interior points")
     
+    if recips is None:
+        recips = step_reciprocals(h)
+    inv_h, inv_2h, inv_h2, _ = recips
+    
     if order == 1:
         # f'(xᵢ) ≈ (f(xᵢ₊₁) - f(xᵢ₋₁)) / (2h)
-        derivative = (f_values[point_index + 1] - f_values[point_index - 1]) / (2 * h)
+        derivative = (f_values[point_index + 1] - f_values[point_index - 1]) * inv_2h
     elif order == 2:
         # f''(xᵢ) ≈ (f(xᵢ₊₁) - 2f(xᵢ) + f(xᵢ₋₁)) / h²
         derivative = (f_values[point_index + 1] - 2 * f_values[point_index] + 
-                     f_values[point_index - 1]) / (h ** 2)
+                     f_values[point_index - 1]) * inv_h2
     else:
         raise ValueError("Only first and second derivatives are supported")
     
     return derivative
 
-def print_difference_table(table, n, table_type="Forward"):
-    """Print forward or backward difference table in formatted manner"""
-    print(f"\n{table_type} Difference Table:")
-    print("-" * (15 * (n + 1)))
+def central_difference_all(f_values, h, recips=None):
+    """
+    Central differences at every interior point in one NumPy pass
+    
+    Returns:
+    - (f_prime, f_double_prime) arrays of length n-2; element i-1 belongs to x_i
+    """
+    if recips is None:
+        recips = step_reciprocals(h)
+    inv_h, inv_2h, inv_h2, _ = recips
+    
+    f = np.asarray(f_values, dtype=np.float64)
+    f_prime = (f[2:] - f[:-2]) * inv_2h
+    f_double_prime = (f[2:] - 2 * f[1:-1] + f[:-2]) * inv_h2
+    return f_prime, f_double_prime
+
+def format_difference_table(table, n, table_type="Forward"):
+    """Return the lines of a forward or backward difference table in formatted manner"""
+    rule = "-" * (15 * (n + 1))
+    lines = [f"\n{table_type} Difference Table:", rule]
     
     # Header
     header = "i\tf(x)\t"
@@ -166,77 +303,111 @@ def print_difference_table(table, n, table_type="Forward"):
             header += f"Δ^{j}f\t"
         else:
             header += f"∇^{j}f\t"
-    print(header)
-    print("-" * (15 * (n + 1)))
+    lines += [header, rule]
+    
+    # Which cells hold a difference depends only on the table shape
+    idx = np.arange(n)
+    if table_type == "Forward":
+        valid = np.add.outer(idx, idx) < n
+        offset = np.zeros(n, dtype=int)
+    else:
+        valid = idx[:, None] >= idx[None, :]
+        offset = idx
+    
+    # Scatter the columns into a dense column-major grid (each column write is
+    # stride-1) and format every cell in one call
+    dense = np.zeros((n, n), order="F")
+    for j in range(n):
+        dense[offset[j]:offset[j] + len(table[j]), j] = table[j]
+    cells = np.char.mod("%.4f", dense)
+    cells[~valid] = "-"
     
     # Data rows
     for i in range(n):
-        row = f"{i}\t{table[i][0]:.4f}\t"
-        for j in range(1, n):
-            if table[i][j] != 0 or (table_type == "Forward" and i + j < n) or (table_type == "Backward" and i >= j):
-                row += f"{table[i][j]:.4f}\t"
-            else:
-                row += "-\t"
-        print(row)
-    print("-" * (15 * (n + 1)))
+        lines.append(f"{i}\t" + "\t".join(cells[i]) + "\t")
+    lines.append(rule)
+    return lines
 
-def run_section2(x_values, f_values, h):
+def print_difference_table(table, n, table_type="Forward"):
+    """Print forward or backward difference table in formatted manner"""
+    print("\n".join(format_difference_table(table, n, table_type)))
+
+def _compute_section2(x_values, f_values, h):
     """
-    Execute Section 2: Equally spaced numerical differentiation
+    Numeric part of Section 2: difference table and all derivatives, no output
+    
+    Returns a dict of arrays; forward/backward entries are aligned with
+    forward_index/backward_index, central entries with x_1 .. x_(n-2)
     """
     n = len(x_values)
     
-    print("\n" + "="*70)
-    print("SECTION 2: DERIVATIVES USING EQUALLY SPACED VALUES")
-    print("="*70)
-    print(f"\nStep size h = {h:.6f}")
+    # ∇^j f_i = Δ^j f_(i-j): the backward table reads the same columns
+    table = forward_difference_table(f_values, n, out=_scratch_buffer(table_size(n)))
+    
+    forward_index = np.arange(min(3, n - 2))
+    backward_index = np.arange(max(n - 3, 2), n)
+    recips = step_reciprocals(h)
+    central_d1, central_d2 = central_difference_all(f_values, h, recips=recips)
     
-    # Construct and display forward difference table
-    forward_table = forward_difference_table(f_values, n)
-    print_difference_table(forward_table, n, "Forward")
+    def forward(i, order):
+        return newton_forward_derivative(x_values, f_values, h, i, order, table=table, recips=recips)
     
-    # Construct and display backward difference table
-    backward_table = backward_difference_table(f_values, n)
-    print_difference_table(backward_table, n, "Backward")
+    def backward(i, order):
+        return newton_backward_derivative(x_values, f_values, h, i, order, table=table, recips=recips)
     
-    print("\n" + "="*70)
-    print("DERIVATIVE CALCULATIONS")
-    print("="*70)
+    return {
+        "table": table,
+        "forward_index": forward_index,
+        "forward_d1": np.array([forward(i, 1) for i in forward_index]),
+        "forward_d2": np.array([forward(i, 2) for i in forward_index]),
+        "central_d1": central_d1,
+        "central_d2": central_d2,
+        "backward_index": backward_index,
+        "backward_d1": np.array([backward(i, 1) for i in backward_index]),
+        "backward_d2": np.array([backward(i, 2) for i in backward_index]),
+    }
+
+def _print_section2(x_values, h, results):
+    """Format the Section 2 results and write them to stdout in one call"""
+    n = len(x_values)
+    table = results["table"]
+    
+    lines = ["\n" + "="*70,
+             "SECTION 2: DERIVATIVES USING EQUALLY SPACED VALUES",
+             "="*70,
+             f"\nStep size h = {h:.6f}"]
+    lines += format_difference_table(table, n, "Forward")
+    lines += format_difference_table(table, n, "Backward")
+    lines += ["\n" + "="*70, "DERIVATIVE CALCULATIONS", "="*70]
     
     # 2.1: Newton's Forward Difference Method (for beginning points)
-    print("\n--- 2.1: Newton's Forward Difference Formula ---")
-    for i in range(min(3, n - 2)):
-        try:
-            f_prime = newton_forward_derivative(x_values, f_values, h, i, order=1)
-            print(f"f'(x_{i}) at x = {x_values[i]:.4f}: {f_prime:.6f}")
-            
-            if n > i + 2:
-                f_double_prime = newton_forward_derivative(x_values, f_values, h, i, order=2)
-                print(f"f''(x_{i}) at x = {x_values[i]:.4f}: {f_double_prime:.6f}")
-        except Exception as e:
-            print(f"Error calculating at index {i}: {e}")
+    lines.append("\n--- 2.1: Newton's Forward Difference Formula ---")
+    for i, d1, d2 in zip(results["forward_index"], results["forward_d1"], results["forward_d2"]):
+        lines.append(f"f'(x_{i}) at x = {x_values[i]:.4f}: {d1:.6f}")
+        lines.append(f"f''(x_{i}) at x = {x_values[i]:.4f}: {d2:.6f}")
     
     # Central differences for interior points
-    print("\n--- Central Difference Method (Interior Points) ---")
+    lines.append("\n--- Central Difference Method (Interior Points) ---")
     for i in range(1, n - 1):
-        try:
-            f_prime = central_difference(f_values, h, i, order=1)
-            print(f"f'(x_{i}) at x = {x_values[i]:.4f}: {f_prime:.6f}")
-            
-            f_double_prime = central_difference(f_values, h, i, order=2)
-            print(f"f''(x_{i}) at x = {x_values[i]:.4f}: {f_double_prime:.6f}")
-        except Exception as e:
-            print(f"Error calculating at index {i}: {e}")
+        lines.append(f"f'(x_{i}) at x = {x_values[i]:.4f}: {results['central_d1'][i - 1]:.6f}")
+        lines.append(f"f''(x_{i}) at x = {x_values[i]:.4f}: {results['central_d2'][i - 1]:.6f}")
     
     # 2.2: Newton's Backward Difference Method (for ending points)
-    print("\n--- 2.2: Newton's Backward Difference Formula ---")
-    for i in range(max(n - 3, 2), n):
-        try:
-            f_prime = newton_backward_derivative(x_values, f_values, h, i, order=1)
-            print(f"f'(x_{i}) at x = {x_values[i]:.4f}: {f_prime:.6f}")
-            
-            if i >= 2:
-                f_double_prime = newton_backward_derivative(x_values, f_values, h, i, order=2)
-                print(f"f''(x_{i}) at x = {x_values[i]:.4f}: {f_double_prime:.6f}")
-        except Exception as e:
-            print(f"Error calculating at index {i}: {e}")
+    lines.append("\n--- 2.2: Newton's Backward Difference Formula ---")
+    for i, d1, d2 in zip(results["backward_index"], results["backward_d1"], results["backward_d2"]):
+        lines.append(f"f'(x_{i}) at x = {x_values[i]:.4f}: {d1:.6f}")
+        lines.append(f"f''(x_{i}) at x = {x_values[i]:.4f}: {d2:.6f}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def run_section2(x_values, f_values, h, return_derivs=False):
+    """
+    Execute Section 2: Equally spaced numerical differentiation
+    
+    With return_derivs=True, returns the interior central differences
+    (f_prime, f_double_prime) so that run_section4 can reuse them
+    """
+    results = _compute_section2(x_values, f_values, h)
+    _print_section2(x_values, h, results)
+    if return_derivs:
+        return results["central_d1"], results["central_d2"]
@@ -4,7 +4,116 @@ Section 3: Derivatives using unequally spaced values of argument
 - 3.2 Unequally spaced backward difference
 """
 
-def unequally_spaced_forward(x_values, f_values, point_index=0):
+import sys
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator used when numba is not installed"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Stencil sides in the precomputed coefficient array
+FORWARD = 0
+CENTRAL = 1
+BACKWARD = 2
+
+def precompute_uneq_coeffs(x_values):
+    """
+    Precompute the three-point Lagrange coefficients for every point and stencil side
+    
+    The coefficients depend only on x, so they can be reused for any f values.
+    
+    Returns:
+    - array C of shape (n, 3, 3): C[i, side] holds the weights of the three stencil
+      points in increasing x order (side FORWARD: x_i..x_(i+2), CENTRAL: x_(i-1)..x_(i+1),
+      BACKWARD: x_(i-2)..x_i); NaN where the stencil does not fit
+    """
+    x = np.asarray(x_values, dtype=np.float64)
+    n = len(x)
+    C = np.full((n, 3, 3), np.nan)
+    a, b, c = x[:-2], x[1:-1], x[2:]
+    
+    # Repeated x values give inf/NaN weights rather than raising
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Forward at a: f'(a) ≈ fa·(2a-b-c)/((a-b)(a-c)) + fb·(a-c)/((b-a)(b-c)) + fc·(a-b)/((c-a)(c-b))
+        C[:n - 2, FORWARD, 0] = (2 * a - b - c) / ((a - b) * (a - c))
+        C[:n - 2, FORWARD, 1] = (a - c) / ((b - a) * (b - c))
+        C[:n - 2, FORWARD, 2] = (a - b) / ((c - a) * (c - b))
+        
+        # Central at b: f'(b) ≈ fa·(b-c)/((a-b)(a-c)) + fb·(2b-a-c)/((b-a)(b-c)) + fc·(b-a)/((c-a)(c-b))
+        C[1:n - 1, CENTRAL, 0] = (b - c) / ((a - b) * (a - c))
+        C[1:n - 1, CENTRAL, 1] = (2 * b - a - c) / ((b - a) * (b - c))
+        C[1:n - 1, CENTRAL, 2] = (b - a) / ((c - a) * (c - b))
+        
+        # Backward at c: f'(c) ≈ fa·(c-b)/((a-c)(a-b)) + fb·(c-a)/((b-c)(b-a)) + fc·(2c-b-a)/((c-b)(c-a))
+        C[2:, BACKWARD, 0] = (c - b) / ((a - c) * (a - b))
+        C[2:, BACKWARD, 1] = (c - a) / ((b - c) * (b - a))
+        C[2:, BACKWARD, 2] = (2 * c - b - a) / ((c - b) * (c - a))
+    
+    return C
+
+@njit(inline="always", cache=True)
+def _three_point_deriv(x0, x1, x2, f0, f1, f2, x_eval):
+    """
+    Derivative at x_eval of the Lagrange polynomial through (x0, f0), (x1, f1), (x2, f2)
+    Shared by the forward, central and backward formulas, which differ only in
+    which three points are passed and where the derivative is evaluated
+    """
+    d01 = x0 - x1
+    d02 = x0 - x2
+    d12 = x1 - x2
+    c0 = (2 * x_eval - x1 - x2) / (d01 * d02)
+    c1 = (2 * x_eval - x0 - x2) / (-d01 * d12)
+    c2 = (2 * x_eval - x0 - x1) / (d02 * d12)
+    return f0 * c0 + f1 * c1 + f2 * c2
+
+# Prefer the ahead-of-time compiled kernel (built by compile_kernels.py): no JIT warmup
+try:
+    from numdiff_kernels import three_point_deriv as _three_point
+    AOT_AVAILABLE = True
+except ImportError:
+    _three_point = _three_point_deriv
+    AOT_AVAILABLE = False
+
+def unequally_spaced_all(x_values, f_values, coeffs=None):
+    """
+    First derivative at every point with all three stencils in one vectorized pass
+    
+    Parameters:
+    - x_values: list of x values (unequally spaced)
+    - f_values: list of function values
+    - coeffs: optional result of precompute_uneq_coeffs(x_values)
+    
+    Returns:
+    - array of shape (n, 3): column FORWARD, CENTRAL or BACKWARD holds f'(x_i)
+      from that stencil, NaN where the stencil does not fit
+    """
+    f = np.asarray(f_values, dtype=np.float64)
+    n = len(f)
+    derivs = np.full((n, 3), np.nan)
+    if n < 3:
+        # No three-point stencil fits
+        return derivs
+    if coeffs is None:
+        coeffs = precompute_uneq_coeffs(x_values)
+    
+    # windows[k] = (f_k, f_(k+1), f_(k+2)) is the stencil for forward at k,
+    # central at k+1 and backward at k+2
+    windows = np.lib.stride_tricks.sliding_window_view(f, 3)
+    derivs[:n - 2, FORWARD] = np.einsum("ij,ij->i", coeffs[:n - 2, FORWARD], windows)
+    derivs[1:n - 1, CENTRAL] = np.einsum("ij,ij->i", coeffs[1:n - 1, CENTRAL], windows)
+    derivs[2:, BACKWARD] = np.einsum("ij,ij->i", coeffs[2:, BACKWARD], windows)
+    return derivs
+
+def unequally_spaced_forward(x_values, f_values, point_index=0, coeffs=None):
     """
     3.1: Calculate first derivative using forward difference for unequally spaced data
     Uses three-point formula based on Lagrange interpolation
@@ -13,6 +122,7 @@ def unequally_spaced_forward(x_values, f_values, point_index=0):
     - x_values: list of x values (unequally spaced)
     - f_values: list of function values
     - point_index: index of point where derivative is needed
+    - coeffs: optional result of precompute_uneq_coeffs(x_values)
     
     Returns:
     - first derivative at specified point
@@ -22,27 +132,19 @@ def unequally_spaced_forward(x_values, f_values, point_index=0):
     if point_index + 2 >= n:
         raise ValueError("Not enough points ahead for forward difference")
     
-    x0 = x_values[point_index]
-    x1 = x_values[point_index + 1]
-    x2 = x_values[point_index + 2]
-    
-    f0 = f_values[point_index]
-    f1 = f_values[point_index + 1]
-    f2 = f_values[point_index + 2]
+    if coeffs is not None:
+        i = point_index
+        return float(coeffs[i, FORWARD] @ np.asarray(f_values[i:i + 3], dtype=np.float64))
     
     # Three-point forward difference formula for unequal spacing
-    # f'(x₀) ≈ f₀·[(2x₀-x₁-x₂)/((x₀-x₁)(x₀-x₂))] + f₁·[(2x₀-x₀-x₂)/((x₁-x₀)(x₁-x₂))] 
-    #        + f₂·[(2x₀-x₀-x₁)/((x₂-x₀)(x₂-x₁))]
-    
-    coeff0 = (2 * x0 - x1 - x2) / ((x0 - x1) * (x0 - x2))
-    coeff1 = (2 * x0 - x0 - x2) / ((x1 - x0) * (x1 - x2))
-    coeff2 = (2 * x0 - x0 - x1) / ((x2 - x0) * (x2 - x1))
-    
-    derivative = f0 * coeff0 + f1 * coeff1 + f2 * coeff2
-    
-    return derivative
+    # f'(x₀) ≈ f₀·[(2x₀-x₁-x₂)/((x₀-x₁)(x₀-x₂))] + f₁·[(x₀-x₂)/((x₁-x₀)(x₁-x₂))] 
+    #        + f₂·[(x₀-x₁)/((x₂-x₀)(x₂-x₁))]
+    i = point_index
+    return _three_point(x_values[i], x_values[i + 1], x_values[i + 2],
+                        f_values[i], f_values[i + 1], f_values[i + 2],
+                        x_values[i])
 
-def unequally_spaced_backward(x_values, f_values, point_index=None):
+def unequally_spaced_backward(x_values, f_values, point_index=None, coeffs=None):
     """
     3.2: Calculate first derivative using backward difference for unequally spaced data
     Uses three-point formula based on Lagrange interpolation
@@ -51,6 +153,7 @@ def unequally_spaced_backward(x_values, f_values, point_index=None):
     - x_values: list of x values (unequally spaced)
     - f_values: list of function values
     - point_index: index of point where derivative is needed (default: last point)
+    - coeffs: optional result of precompute_uneq_coeffs(x_values)
     
     Returns:
     - first derivative at specified point
@@ -62,24 +165,17 @@ def unequally_spaced_backward(x_values, f_values, point_index=None):
     if point_index < 2:
         raise ValueError("Not enough points behind for backward difference")
     
-    xn = x_values[point_index]
-    xn_1 = x_values[point_index - 1]
-    xn_2 = x_values[point_index - 2]
-    
-    fn = f_values[point_index]
-    fn_1 = f_values[point_index - 1]
-    fn_2 = f_values[point_index - 2]
+    if coeffs is not None:
+        i = point_index
+        return float(coeffs[i, BACKWARD] @ np.asarray(f_values[i - 2:i + 1], dtype=np.float64))
     
     # Three-point backward difference formula for unequal spacing
-    coeffn = (2 * xn - xn_1 - xn_2) / ((xn - xn_1) * (xn - xn_2))
-    coeffn_1 = (2 * xn - xn - xn_2) / ((xn_1 - xn) * (xn_1 - xn_2))
-    coeffn_2 = (2 * xn - xn - xn_1) / ((xn_2 - xn) * (xn_2 - xn_1))
-    
-    derivative = fn * coeffn + fn_1 * coeffn_1 + fn_2 * coeffn_2
-    
-    return derivative
+    i = point_index
+    return _three_point(x_values[i - 2], x_values[i - 1], x_values[i],
+                        f_values[i - 2], f_values[i - 1], f_values[i],
+                        x_values[i])
 
-def unequally_spaced_central(x_values, f_values, point_index):
+def unequally_spaced_central(x_values, f_values, point_index, coeffs=None):
     """
     Calculate first derivative using central-like approach for unequally spaced data
     Uses three-point formula centered at the point of interest
@@ -88,6 +184,7 @@ def unequally_spaced_central(x_values, f_values, point_index):
     - x_values: list of x values (unequally spaced)
     - f_values: list of function values
     - point_index: index of point where derivative is needed
+    - coeffs: optional result of precompute_uneq_coeffs(x_values)
     
     Returns:
     - first derivative at specified point
@@ -97,66 +194,60 @@ def unequally_spaced_central(x_values, f_values, point_index):
     if point_index <= 0 or point_index >= n - 1:
         raise ValueError("Central difference requires interior points")
     
-    x_prev = x_values[point_index - 1]
-    x_curr = x_values[point_index]
-    x_next = x_values[point_index + 1]
-    
-    f_prev = f_values[point_index - 1]
-    f_curr = f_values[point_index]
-    f_next = f_values[point_index + 1]
+    if coeffs is not None:
+        i = point_index
+        return float(coeffs[i, CENTRAL] @ np.asarray(f_values[i - 1:i + 2], dtype=np.float64))
     
     # Three-point formula using points before, at, and after
-    coeff_prev = (2 * x_curr - x_curr - x_next) / ((x_prev - x_curr) * (x_prev - x_next))
-    coeff_curr = (2 * x_curr - x_prev - x_next) / ((x_curr - x_prev) * (x_curr - x_next))
-    coeff_next = (2 * x_curr - x_prev - x_curr) / ((x_next - x_prev) * (x_next - x_curr))
-    
-    derivative = f_prev * coeff_prev + f_curr * coeff_curr + f_next * coeff_next
-    
-    return derivative
+    i = point_index
+    return _three_point(x_values[i - 1], x_values[i], x_values[i + 1],
+                        f_values[i - 1], f_values[i], f_values[i + 1],
+                        x_values[i])
 
-def run_section3(x_values, f_values):
-    """
-    Execute Section 3: Unequally spaced numerical differentiation
-    """
+def _compute_section3(x_values, f_values):
+    """Numeric part of Section 3: spacings and all stencil derivatives, no output"""
+    return {
+        "spacings": np.diff(np.asarray(x_values, dtype=np.float64)),
+        "derivs": unequally_spaced_all(x_values, f_values),
+    }
+
+def _print_section3(x_values, results):
+    """Format the Section 3 results and write them to stdout in one call"""
     n = len(x_values)
+    spacings = results["spacings"]
+    derivs = results["derivs"]
     
-    print("\n" + "="*70)
-    print("SECTION 3: DERIVATIVES USING UNEQUALLY SPACED VALUES")
-    print("="*70)
+    lines = ["\n" + "="*70,
+             "SECTION 3: DERIVATIVES USING UNEQUALLY SPACED VALUES",
+             "="*70]
     
     # Display spacing information
-    print("\nSpacing between consecutive points:")
+    lines.append("\nSpacing between consecutive points:")
     for i in range(n - 1):
-        spacing = x_values[i + 1] - x_values[i]
-        print(f"h_{i} = x_{i+1} - x_{i} = {spacing:.6f}")
+        lines.append(f"h_{i} = x_{i+1} - x_{i} = {spacings[i]:.6f}")
     
-    print("\n" + "="*70)
-    print("DERIVATIVE CALCULATIONS")
-    print("="*70)
+    lines += ["\n" + "="*70, "DERIVATIVE CALCULATIONS", "="*70]
     
     # 3.1: Unequally Spaced Forward Difference
-    print("\n--- 3.1: Unequally Spaced Forward Difference ---")
+    lines.append("\n--- 3.1: Unequally Spaced Forward Difference ---")
     for i in range(min(3, n - 2)):
-        try:
-            f_prime = unequally_spaced_forward(x_values, f_values, i)
-            print(f"f'(x_{i}) at x = {x_values[i]:.4f}: {f_prime:.6f}")
-        except Exception as e:
-            print(f"Error at index {i}: {e}")
+        lines.append(f"f'(x_{i}) at x = {x_values[i]:.4f}: {derivs[i, FORWARD]:.6f}")
     
     # Central-like differences for interior points
-    print("\n--- Unequally Spaced Central-Like Difference (Interior Points) ---")
+    lines.append("\n--- Unequally Spaced Central-Like Difference (Interior Points) ---")
     for i in range(1, n - 1):
-        try:
-            f_prime = unequally_spaced_central(x_values, f_values, i)
-            print(f"f'(x_{i}) at x = {x_values[i]:.4f}: {f_prime:.6f}")
-        except Exception as e:
-            print(f"Error at index {i}: {e}")
+        lines.append(f"f'(x_{i}) at x = {x_values[i]:.4f}: {derivs[i, CENTRAL]:.6f}")
     
     # 3.2: Unequally Spaced Backward Difference
-    print("\n--- 3.2: Unequally Spaced Backward Difference ---")
+    lines.append("\n--- 3.2: Unequally Spaced Backward Difference ---")
     for i in range(max(2, n - 3), n):
-        try:
-            f_prime = unequally_spaced_backward(x_values, f_values, i)
-            print(f"f'(x_{i}) at x = {x_values[i]:.4f}: {f_prime:.6f}")
-        except Exception as e:
-            print(f"Error at index {i}: {e}")
+        lines.append(f"f'(x_{i}) at x = {x_values[i]:.4f}: {derivs[i, BACKWARD]:.6f}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def run_section3(x_values, f_values):
+    """
+    Execute Section 3: Unequally spaced numerical differentiation
+    """
+    results = _compute_section3(x_values, f_values)
+    _print_section3(x_values, results)
@@ -6,63 +6,158 @@ Section 4: Analysis of tabulated functions
 """
 
 import sys
-import os
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator used when numba is not installed"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    from scipy.signal import argrelextrema
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
 
 # Import needed functions from other sections
-sys.path.append(os.path.dirname(__file__))
-from section2_equally_spaced import central_difference
-from section3_unequally_spaced import unequally_spaced_central
+from section2_equally_spaced import central_difference_all, PARALLEL_THRESHOLD
+
+@njit(parallel=True, cache=True)
+def _extrema_kind_nb(f):
+    """
+    Compiled scan of the interior points: kind[i] is 1 for a local maximum,
+    -1 for a local minimum and 0 otherwise (each point writes only its own slot)
+    """
+    n = len(f)
+    kind = np.zeros(n, dtype=np.int8)
+    for i in prange(1, n - 1):
+        if f[i] > f[i-1] and f[i] > f[i+1]:
+            kind[i] = 1
+        elif f[i] < f[i-1] and f[i] < f[i+1]:
+            kind[i] = -1
+    return kind
+
+# Extremum type codes used in Extrema.type_code
+MINIMUM = 0
+MAXIMUM = 1
+
+# Concavity codes used in Extrema.concavity_code
+INFLECTION = 0
+CONCAVE_UP = 1
+CONCAVE_DOWN = -1
+UNKNOWN = 2
 
-def find_extrema(x_values, f_values, h=None, is_equally_spaced=True):
+# Display strings, materialized only when the results are printed
+_TYPE_NAMES = {MINIMUM: "Minimum", MAXIMUM: "Maximum"}
+_CONCAVITY_NAMES = {
+    CONCAVE_UP: "Concave up",
+    CONCAVE_DOWN: "Concave down",
+    INFLECTION: "Inflection point",
+    UNKNOWN: "Unknown"
+}
+_SECOND_TEST_MESSAGES = {
+    CONCAVE_UP: "f'' = {:.6f} > 0 → Local Minimum",
+    CONCAVE_DOWN: "f'' = {:.6f} < 0 → Local Maximum",
+    INFLECTION: "f'' ≈ 0 → Test inconclusive",
+    UNKNOWN: "Unable to compute (insufficient data)"
+}
+_EXPECTED_CONCAVITY = {MINIMUM: CONCAVE_UP, MAXIMUM: CONCAVE_DOWN}
+
+@dataclass
+class Extrema:
+    """
+    Extrema of a tabulated function stored as parallel arrays
+    (element k of every array describes the k-th extremum)
+    """
+    index: np.ndarray
+    x: np.ndarray
+    fx: np.ndarray
+    type_code: np.ndarray           # MINIMUM or MAXIMUM (int8)
+    fprime: np.ndarray
+    fdouble: np.ndarray             # NaN where f'' could not be computed
+    is_critical: Optional[np.ndarray] = None      # set by first_derivative_test
+    concavity_code: Optional[np.ndarray] = None   # set by second_derivative_test
+    
+    def __len__(self):
+        return len(self.index)
+
+def find_extrema(x_values, f_values, h=None, is_equally_spaced=True, precomputed=None):
     """
     4.1: Find local maxima and minima in tabulated function data
     
     Parameters:
-    - x_values: list of x values
-    - f_values: list of function values
+    - x_values: x values (list or float64 array)
+    - f_values: function values (list or float64 array)
     - h: step size (for equally spaced data)
     - is_equally_spaced: whether data points are equally spaced
+    - precomputed: optional (f_prime, f_double_prime) interior central differences
+      from run_section2(..., return_derivs=True); element i-1 belongs to x_i
     
     Returns:
-    - list of dictionaries containing extrema information
+    - Extrema record with one array entry per extremum
     """
-    n = len(f_values)
-    extrema = []
-    
-    # Check interior points for potential extrema
-    for i in range(1, n - 1):
-        # Check if it's a local maximum or minimum
-        if f_values[i] > f_values[i-1] and f_values[i] > f_values[i+1]:
-            extrema_type = "Maximum"
-        elif f_values[i] < f_values[i-1] and f_values[i] < f_values[i+1]:
-            extrema_type = "Minimum"
-        else:
-            continue
-        
-        # Calculate first derivative at this point
-        if is_equally_spaced and h is not None:
-            f_prime = central_difference(f_values, h, i, order=1)
-            f_double_prime = central_difference(f_values, h, i, order=2)
-        else:
-            f_prime = unequally_spaced_central(x_values, f_values, i)
-            # For second derivative, use finite difference approximation
-            if i > 1 and i < n - 2:
-                h_left = x_values[i] - x_values[i-1]
-                h_right = x_values[i+1] - x_values[i]
-                f_double_prime = (f_values[i+1] - 2*f_values[i] + f_values[i-1]) / ((h_left + h_right) / 2)**2
-            else:
-                f_double_prime = None
-        
-        extrema.append({
-            'index': i,
-            'x': x_values[i],
-            'f(x)': f_values[i],
-            'type': extrema_type,
-            'f_prime': f_prime,
-            'f_double_prime': f_double_prime
-        })
+    x = np.asarray(x_values, dtype=np.float64)
+    f = np.asarray(f_values, dtype=np.float64)
+    n = len(f)
     
-    return extrema
+    # Compare every interior point with both neighbours at once (3-point stencil);
+    # idx holds the extremum indices in increasing order, is_max the type of each
+    if NUMBA_AVAILABLE and n >= PARALLEL_THRESHOLD:
+        kind = _extrema_kind_nb(f)
+        idx = np.flatnonzero(kind)
+        is_max = kind[idx] == 1
+    elif SCIPY_AVAILABLE:
+        max_idx = argrelextrema(f, np.greater)[0]
+        min_idx = argrelextrema(f, np.less)[0]
+        order = np.argsort(np.concatenate((max_idx, min_idx)), kind="stable")
+        idx = np.concatenate((max_idx, min_idx))[order]
+        is_max = order < len(max_idx)
+    else:
+        mid, left, right = f[1:-1], f[:-2], f[2:]
+        is_max_mask = (mid > left) & (mid > right)
+        is_min_mask = (mid < left) & (mid < right)
+        idx = np.flatnonzero(is_max_mask | is_min_mask) + 1
+        is_max = is_max_mask[idx - 1]
+    
+    if is_equally_spaced and h is not None:
+        # Equally spaced data: central differences for all interior points in one pass
+        if precomputed is None:
+            precomputed = central_difference_all(f, h)
+        f_prime = np.asarray(precomputed[0], dtype=np.float64)[idx - 1]
+        f_double_prime = np.asarray(precomputed[1], dtype=np.float64)[idx - 1]
+    else:
+        # Unequally spaced data: derivatives at the extremum indices only, in one pass
+        dx_left = x[idx] - x[idx - 1]
+        dx_right = x[idx + 1] - x[idx]
+        # Central three-point first derivative (same weights as section 3's CENTRAL stencil):
+        # f' ≈ (-h_r² f_(i-1) + (h_r² - h_l²) f_i + h_l² f_(i+1)) / (h_l h_r (h_l + h_r))
+        f_prime = ((dx_left * dx_left * f[idx + 1] - dx_right * dx_right * f[idx - 1]
+                    + (dx_right * dx_right - dx_left * dx_left) * f[idx])
+                   / (dx_left * dx_right * (dx_left + dx_right)))
+        # Three-point second derivative for non-uniform steps h_l = x_i - x_(i-1), h_r = x_(i+1) - x_i:
+        # f'' ≈ 2(h_r f_(i-1) - (h_l + h_r) f_i + h_l f_(i+1)) / (h_l h_r (h_l + h_r))
+        f_double_prime = (2 * (dx_right * f[idx - 1] - (dx_left + dx_right) * f[idx] + dx_left * f[idx + 1])
+                          / (dx_left * dx_right * (dx_left + dx_right)))
+    
+    return Extrema(
+        index=idx,
+        x=x[idx],
+        fx=f[idx],
+        type_code=np.where(is_max, MAXIMUM, MINIMUM).astype(np.int8),
+        fprime=f_prime,
+        fdouble=f_double_prime
+    )
 
 def first_derivative_test(extrema):
     """
@@ -73,22 +168,12 @@ def first_derivative_test(extrema):
     - If f'(x) changes from negative to positive, x is a local minimum
     
     Parameters:
-    - extrema: list of extrema dictionaries from find_extrema
+    - extrema: Extrema record from find_extrema
     
     Returns:
-    - Updated extrema list with first derivative test results
+    - The same record with is_critical set (True where f'(x) ≈ 0)
     """
-    for ext in extrema:
-        f_prime = ext['f_prime']
-        
-        # Classification based on first derivative
-        if abs(f_prime) < 1e-6:  # Close to zero
-            if ext['type'] == "Maximum":
-                ext['first_derivative_test'] = "Critical point (f'≈0), likely Maximum"
-            else:
-                ext['first_derivative_test'] = "Critical point (f'≈0), likely Minimum"
-        else:
-            ext['first_derivative_test'] = f"f' = {f_prime:.6f} (not exactly zero, approximate extremum)"
+    extrema.is_critical = _critical_mask(extrema.fprime)
     
     return extrema
 
@@ -102,106 +187,118 @@ def second_derivative_test(extrema):
     - If f''(x) = 0, the test is inconclusive
     
     Parameters:
-    - extrema: list of extrema dictionaries from find_extrema
+    - extrema: Extrema record from find_extrema
     
     Returns:
-    - Updated extrema list with second derivative test results
+    - The same record with concavity_code set to CONCAVE_UP, CONCAVE_DOWN,
+      INFLECTION or UNKNOWN (f'' not available)
     """
-    for ext in extrema:
-        f_double_prime = ext['f_double_prime']
-        
-        if f_double_prime is None:
-            ext['second_derivative_test'] = "Unable to compute (insufficient data)"
-            ext['concavity'] = "Unknown"
-        elif f_double_prime > 1e-6:
-            ext['second_derivative_test'] = f"f'' = {f_double_prime:.6f} > 0 → Local Minimum"
-            ext['concavity'] = "Concave up"
-        elif f_double_prime < -1e-6:
-            ext['second_derivative_test'] = f"f'' = {f_double_prime:.6f} < 0 → Local Maximum"
-            ext['concavity'] = "Concave down"
-        else:
-            ext['second_derivative_test'] = f"f'' ≈ 0 → Test inconclusive"
-            ext['concavity'] = "Inflection point"
+    extrema.concavity_code = _concavity_codes(extrema.fdouble)
+    
+    return extrema
+
+def _critical_mask(fprime):
+    """First derivative test on an array of f' values: True where f'(x) ≈ 0"""
+    return np.abs(fprime) < 1e-6
+
+def _concavity_codes(fdouble):
+    """Second derivative test on an array of f'' values (NaN → UNKNOWN)"""
+    return np.select(
+        [np.isnan(fdouble), fdouble > 1e-6, fdouble < -1e-6],
+        [UNKNOWN, CONCAVE_UP, CONCAVE_DOWN],
+        default=INFLECTION
+    )
+
+def analyze_extrema(x_values, f_values, h=None, is_equally_spaced=True, precomputed=None):
+    """
+    4.1-4.3 in one pass: detect the extrema, evaluate f' and f'' at them and
+    apply both derivative tests while the derivative arrays are at hand
     
+    Takes the same arguments as find_extrema and returns a fully classified
+    Extrema record (is_critical and concavity_code set). find_extrema,
+    first_derivative_test and second_derivative_test remain available for
+    running the steps separately.
+    """
+    extrema = find_extrema(x_values, f_values, h, is_equally_spaced, precomputed)
+    extrema.is_critical = _critical_mask(extrema.fprime)
+    extrema.concavity_code = _concavity_codes(extrema.fdouble)
     return extrema
 
-def run_section4(x_values, f_values, h=None, is_equally_spaced=True):
+def run_section4(x_values, f_values, h=None, is_equally_spaced=True, precomputed=None):
     """
     Execute Section 4: Analysis of tabulated functions
+    
+    precomputed: optional (f_prime, f_double_prime) returned by
+    run_section2(..., return_derivs=True) for the same data and h
     """
-    print("\n" + "="*70)
-    print("SECTION 4: ANALYSIS OF TABULATED FUNCTIONS")
-    print("="*70)
+    lines = ["\n" + "="*70,
+             "SECTION 4: ANALYSIS OF TABULATED FUNCTIONS",
+             "="*70]
+    
+    # Convert once so every step below works on contiguous float64 buffers
+    x_values = np.asarray(x_values, dtype=np.float64)
+    f_values = np.asarray(f_values, dtype=np.float64)
     
-    # 4.1: Find potential extrema
-    extrema = find_extrema(x_values, f_values, h, is_equally_spaced)
+    # 4.1-4.3: Find potential extrema and apply both derivative tests
+    extrema = analyze_extrema(x_values, f_values, h, is_equally_spaced, precomputed)
     
     if not extrema:
-        print("\nNo local maxima or minima found in the data.")
+        lines.append("\nNo local maxima or minima found in the data.")
+        sys.stdout.write("\n".join(lines) + "\n")
         return
     
-    print(f"\n✓ Found {len(extrema)} potential extrema")
+    lines.append(f"\n✓ Found {len(extrema)} potential extrema")
     
-    # 4.2: Apply first derivative test
-    extrema = first_derivative_test(extrema)
+    # Display results
+    lines += ["\n" + "="*70, "4.1 MAXIMA AND MINIMA OF TABULATED FUNCTION", "="*70]
     
-    # 4.3: Apply second derivative test
-    extrema = second_derivative_test(extrema)
+    for k in range(len(extrema)):
+        lines.append(f"\nExtremum #{k + 1}:")
+        lines.append(f"  Location: x = {extrema.x[k]:.6f} (index {extrema.index[k]})")
+        lines.append(f"  Value: f(x) = {extrema.fx[k]:.6f}")
+        lines.append(f"  Type: {_TYPE_NAMES[extrema.type_code[k]]}")
     
-    # Display results
-    print("\n" + "="*70)
-    print("4.1 MAXIMA AND MINIMA OF TABULATED FUNCTION")
-    print("="*70)
-    
-    for i, ext in enumerate(extrema, 1):
-        print(f"\nExtremum #{i}:")
-        print(f"  Location: x = {ext['x']:.6f} (index {ext['index']})")
-        print(f"  Value: f(x) = {ext['f(x)']:.6f}")
-        print(f"  Type: {ext['type']}")
-    
-    print("\n" + "="*70)
-    print("4.2 FIRST DERIVATIVE TEST FOR MAXIMA AND MINIMA")
-    print("="*70)
-    print("\nTheory: At a local extremum, f'(x) = 0 (or very close to 0)")
-    
-    for i, ext in enumerate(extrema, 1):
-        print(f"\nExtremum #{i} at x = {ext['x']:.6f}:")
-        print(f"  {ext['first_derivative_test']}")
-    
-    print("\n" + "="*70)
-    print("4.3 SECOND DERIVATIVE TEST FOR MAXIMA AND MINIMA")
-    print("="*70)
-    print("\nTheory:")
-    print("  • If f''(x) > 0 → Local Minimum (concave up)")
-    print("  • If f''(x) < 0 → Local Maximum (concave down)")
-    print("  • If f''(x) = 0 → Test inconclusive")
-    
-    for i, ext in enumerate(extrema, 1):
-        print(f"\nExtremum #{i} at x = {ext['x']:.6f}:")
-        print(f"  {ext['second_derivative_test']}")
-        print(f"  Concavity: {ext['concavity']}")
+    lines += ["\n" + "="*70, "4.2 FIRST DERIVATIVE TEST FOR MAXIMA AND MINIMA", "="*70]
+    lines.append("\nTheory: At a local extremum, f'(x) = 0 (or very close to 0)")
+    
+    for k in range(len(extrema)):
+        lines.append(f"\nExtremum #{k + 1} at x = {extrema.x[k]:.6f}:")
+        if extrema.is_critical[k]:
+            lines.append(f"  Critical point (f'≈0), likely {_TYPE_NAMES[extrema.type_code[k]]}")
+        else:
+            lines.append(f"  f' = {extrema.fprime[k]:.6f} (not exactly zero, approximate extremum)")
+    
+    lines += ["\n" + "="*70, "4.3 SECOND DERIVATIVE TEST FOR MAXIMA AND MINIMA", "="*70]
+    lines.append("\nTheory:")
+    lines.append("  • If f''(x) > 0 → Local Minimum (concave up)")
+    lines.append("  • If f''(x) < 0 → Local Maximum (concave down)")
+    lines.append("  • If f''(x) = 0 → Test inconclusive")
+    
+    for k in range(len(extrema)):
+        code = extrema.concavity_code[k]
+        
+        lines.append(f"\nExtremum #{k + 1} at x = {extrema.x[k]:.6f}:")
+        lines.append(f"  {_SECOND_TEST_MESSAGES[code].format(extrema.fdouble[k])}")
+        lines.append(f"  Concavity: {_CONCAVITY_NAMES[code]}")
         
         # Verify consistency
-        if ext['type'] == "Maximum" and ext['concavity'] == "Concave down":
-            print(f"  ✓ Verification: Confirmed as Maximum")
-        elif ext['type'] == "Minimum" and ext['concavity'] == "Concave up":
-            print(f"  ✓ Verification: Confirmed as Minimum")
-        elif ext['concavity'] != "Unknown" and ext['concavity'] != "Inflection point":
-            print(f"  ⚠ Warning: Type mismatch - review data")
-    
-    print("\n" + "="*70)
-    print("SUMMARY OF EXTREMA")
-    print("="*70)
-    
-    maxima = [ext for ext in extrema if ext['type'] == "Maximum"]
-    minima = [ext for ext in extrema if ext['type'] == "Minimum"]
-    
-    if maxima:
-        print("\nLocal Maxima:")
-        for ext in maxima:
-            print(f"  x = {ext['x']:.6f}, f(x) = {ext['f(x)']:.6f}")
-    
-    if minima:
-        print("\nLocal Minima:")
-        for ext in minima:
-            print(f"  x = {ext['x']:.6f}, f(x) = {ext['f(x)']:.6f}")
+        if code == _EXPECTED_CONCAVITY[extrema.type_code[k]]:
+            lines.append(f"  ✓ Verification: Confirmed as {_TYPE_NAMES[extrema.type_code[k]]}")
+        elif code == CONCAVE_UP or code == CONCAVE_DOWN:
+            lines.append(f"  ⚠ Warning: Type mismatch - review data")
+    
+    lines += ["\n" + "="*70, "SUMMARY OF EXTREMA", "="*70]
+    
+    is_max = extrema.type_code == MAXIMUM
+    
+    if is_max.any():
+        lines.append("\nLocal Maxima:")
+        for x, fx in zip(extrema.x[is_max], extrema.fx[is_max]):
+            lines.append(f"  x = {x:.6f}, f(x) = {fx:.6f}")
+    
+    if not is_max.all():
+        lines.append("\nLocal Minima:")
+        for x, fx in zip(extrema.x[~is_max], extrema.fx[~is_max]):
+            lines.append(f"  x = {x:.6f}, f(x) = {fx:.6f}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
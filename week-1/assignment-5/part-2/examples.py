@@ -3,6 +3,7 @@ Examples demonstrating the use of numerical integration methods
 """
 
 import math
+import numpy as np
 from methods.trapezoidal import trapezoidal_rule
 from methods.simpson_one_third import simpson_one_third_rule
 from methods.simpson_three_eighth import simpson_three_eighth_rule
@@ -112,22 +113,24 @@ def example_5_accuracy_comparison():
     print(f"{'n':<10} {'Trapezoidal':<20} {'Simpson 1/3':<20} {'Simpson 3/8':<20}")
     print("-" * 80)
     
-    for n_base in [6, 12, 24, 48]:
-        # n for trapezoidal
-        n_trap = n_base
-        result_trap = trapezoidal_rule(func, a, b, n_trap)
-        error_trap = abs(result_trap['result'] - exact)
-        
-        # n for simpson 1/3 (must be even)
-        n_simp13 = n_base if n_base % 2 == 0 else n_base + 1
-        result_simp13 = simpson_one_third_rule(func, a, b, n_simp13)
-        error_simp13 = abs(result_simp13['result'] - exact)
-        
-        # n for simpson 3/8 (must be divisible by 3)
-        n_simp38 = n_base if n_base % 3 == 0 else n_base + (3 - n_base % 3)
-        result_simp38 = simpson_three_eighth_rule(func, a, b, n_simp38)
-        error_simp38 = abs(result_simp38['result'] - exact)
-        
+    n_values = np.array([6, 12, 24, 48])
+    
+    # n for trapezoidal
+    n_trap = n_values
+    # n for simpson 1/3 (must be even)
+    n_simp13 = n_values + n_values % 2
+    # n for simpson 3/8 (must be divisible by 3)
+    n_simp38 = n_values + (3 - n_values % 3) % 3
+    
+    # One row of results per method, errors for all n in one array operation
+    results = np.array([
+        [trapezoidal_rule(func, a, b, int(n))['result'] for n in n_trap],
+        [simpson_one_third_rule(func, a, b, int(n))['result'] for n in n_simp13],
+        [simpson_three_eighth_rule(func, a, b, int(n))['result'] for n in n_simp38],
+    ])
+    errors = np.abs(results - exact)
+    
+    for n_base, (error_trap, error_simp13, error_simp38) in zip(n_values.tolist(), errors.T.tolist()):
         print(f"{n_base:<10} {error_trap:<20.10e} {error_simp13:<20.10e} {error_simp38:<20.10e}")
 
 
@@ -8,7 +8,11 @@ and allows users to test them on various functions.
 
 import sys
 import math
+from functools import lru_cache
+from types import MappingProxyType
+import numpy as np
 import sympy as sp
+from sympy.parsing.sympy_parser import parse_expr, standard_transformations
 from methods.trapezoidal import trapezoidal_rule
 from methods.simpson_one_third import simpson_one_third_rule
 from methods.simpson_three_eighth import simpson_three_eighth_rule
@@ -29,6 +33,52 @@ from table import (
 )
 
 
+_X = sp.Symbol('x')
+# Names available to user functions, matching the eval namespace in get_function_from_user
+_LOCAL_DICT = {'x': _X, 'e': sp.E, 'pi': sp.pi}
+_TRANSFORMATIONS = standard_transformations
+
+
+@lru_cache(maxsize=128)
+def _parse(func_str: str):
+    """
+    Parse a function string into a sympy expression (cached per string).
+    
+    Parameters:
+        func_str: String representation of the function
+    
+    Returns:
+        sympy expression
+    """
+    # Replace Python operators with sympy equivalents
+    return parse_expr(func_str.replace('^', '**'), local_dict=_LOCAL_DICT,
+                      transformations=_TRANSFORMATIONS, evaluate=True)
+
+
+@lru_cache(maxsize=128)
+def _exact_integral(func_str: str, a: float, b: float) -> float:
+    """
+    Definite integral of func_str over [a, b] via sympy (cached per arguments).
+    Errors are not cached, so a failing query is retried on the next call.
+    """
+    # Calculate definite integral
+    result = sp.integrate(_parse(func_str), (_X, a, b))
+    
+    # Convert to float
+    return float(result.evalf())
+
+
+@lru_cache(maxsize=1)
+def _cached_tests():
+    """
+    Test functions from get_common_test_functions, built once per session.
+    
+    Returns:
+        Read-only mapping of function names to (function, a, b, exact_value, description)
+    """
+    return MappingProxyType(get_common_test_functions())
+
+
 def calculate_exact_integral(func_str: str, a: float, b: float):
     """
     Try to calculate exact integral using sympy.
@@ -42,21 +92,7 @@ def calculate_exact_integral(func_str: str, a: float, b: float):
         Exact value of the integral or None if unable to compute
     """
     try:
-        # Define sympy symbol
-        x = sp.Symbol('x')
-        
-        # Convert string to sympy expression
-        # Replace Python operators with sympy equivalents
-        expr_str = func_str.replace('^', '**')
-        
-        # Parse the expression
-        expr = sp.sympify(expr_str)
-        
-        # Calculate definite integral
-        result = sp.integrate(expr, (x, a, b))
-        
-        # Convert to float
-        exact_value = float(result.evalf())
+        exact_value = _exact_integral(func_str, float(a), float(b))
         
         print(f"\n✓ Exact integral computed: {exact_value:.10f}")
         return exact_value
@@ -66,6 +102,42 @@ def calculate_exact_integral(func_str: str, a: float, b: float):
         return None
 
 
+def _make_vectorized(func_str: str, scalar_func):
+    """
+    Wrap scalar_func so that NumPy arrays are evaluated in one call.
+    
+    Arrays go through sympy.lambdify of the cached parsed expression; scalars
+    keep the math-module semantics (and error messages) of scalar_func. If the
+    expression cannot be lambdified, or contains '^' (XOR under eval but a
+    power after _parse), scalar_func is returned unchanged so that array and
+    scalar calls always agree.
+    
+    Parameters:
+        func_str: String representation of the function
+        scalar_func: Callable evaluating func_str at a single float
+    
+    Returns:
+        Callable accepting a float or a NumPy array
+    """
+    if '^' in func_str:
+        return scalar_func
+    
+    try:
+        expr = _parse(func_str)
+        if not expr.free_symbols <= {_X}:
+            return scalar_func
+        kernel = sp.lambdify(_X, expr, 'numpy')
+    except Exception:
+        return scalar_func
+    
+    def func(x_value):
+        if isinstance(x_value, np.ndarray):
+            return kernel(x_value)
+        return scalar_func(x_value)
+    
+    return func
+
+
 def get_function_from_user():
     """
     Get a function from the user.
@@ -108,14 +180,16 @@ def get_function_from_user():
                 'pow': pow,
             }
             
-            # Create lambda function
-            func = lambda x: eval(func_str, {"__builtins__": {}}, {**safe_namespace, 'x': x})
+            # Compile once and reuse the code object on every call
+            code_obj = compile(func_str, '<user_func>', 'eval')
+            base_ns = {"__builtins__": {}, **safe_namespace}
+            scalar_func = lambda x: eval(code_obj, base_ns, {'x': x})
             
             # Test the function
-            test_val = func(1.0)
+            test_val = scalar_func(1.0)
             print(f"\nTest: f(1) = {test_val}")
             
-            return func, func_str, None
+            return _make_vectorized(func_str, scalar_func), func_str, None
             
         except Exception as e:
             print(f"Error: {str(e)}")
@@ -257,8 +331,8 @@ def run_single_method(method_name: str):
         # Ask if user wants to see computation points
         show_points = input("\nShow computation points? (y/n): ").strip().lower()
         if show_points == 'y':
-            from table import display_computation_points
-            display_computation_points(result['points'])
+            from table import display_computation_points, result_points
+            display_computation_points(result_points(result))
         
     except Exception as e:
         print(f"\nError during integration: {str(e)}")
@@ -357,7 +431,7 @@ def run_comparison():
 
 def run_test_examples():
     """Run predefined test examples."""
-    test_functions = get_common_test_functions()
+    test_functions = _cached_tests()
     
     print("\n" + "="*80)
     print("TEST EXAMPLES")
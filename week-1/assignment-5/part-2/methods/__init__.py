@@ -7,12 +7,15 @@ This module contains implementations of various numerical integration methods:
 - Simpson's 3/8 Rule
 """
 
-from .trapezoidal import trapezoidal_rule
-from .simpson_one_third import simpson_one_third_rule
-from .simpson_three_eighth import simpson_three_eighth_rule
+from .trapezoidal import trapezoidal_rule, make_trapezoidal
+from .simpson_one_third import simpson_one_third_rule, make_simpson_one_third
+from .simpson_three_eighth import simpson_three_eighth_rule, make_simpson_three_eighth
 
 __all__ = [
     'trapezoidal_rule',
     'simpson_one_third_rule',
-    'simpson_three_eighth_rule'
+    'simpson_three_eighth_rule',
+    'make_trapezoidal',
+    'make_simpson_one_third',
+    'make_simpson_three_eighth'
 ]
@@ -0,0 +1,276 @@
+"""
+Evaluation of the integrand on the uniform grid shared by all integration rules.
+"""
+
+import ctypes
+import math
+import multiprocessing as mp
+
+import numpy as np
+
+try:
+    from numba import njit
+    from numba.core.registry import CPUDispatcher
+    from numba.core.ccallback import CFunc
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    CPUDispatcher = ()
+    CFunc = ()
+
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator used when numba is not installed"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    from scipy import LowLevelCallable
+except ImportError:
+    LowLevelCallable = ()
+
+
+@njit(cache=True)
+def _grid_kernel(f, x_values):
+    """
+    Compiled loop evaluating an @njit-decorated scalar function or a C
+    function pointer at every grid point
+    """
+    f_values = np.empty(x_values.shape[0])
+    for i in range(x_values.shape[0]):
+        f_values[i] = f(x_values[i])
+    return f_values
+
+
+def _c_function(func):
+    """
+    ctypes pointer to a C function double f(double) behind func, or None.
+
+    Recognizes numba @cfunc objects, scipy.LowLevelCallable built from a ctypes
+    pointer, and ctypes functions declared with restype/argtypes c_double.
+    The pointer is callable from Python and from the compiled grid loop.
+
+    Raises:
+        TypeError: If func is a scipy.LowLevelCallable that does not wrap such
+            a ctypes function, e.g. a PyCapsule from LowLevelCallable.from_cython,
+            which cannot be called from Python
+    """
+    if isinstance(func, CFunc):
+        return func.ctypes
+    low_level = isinstance(func, LowLevelCallable)
+    if low_level:
+        func = func.function
+    if (getattr(func, 'restype', None) is ctypes.c_double
+            and list(getattr(func, 'argtypes', None) or ()) == [ctypes.c_double]):
+        try:
+            # Only ctypes function pointers (and other ctypes objects) convert to an address
+            ctypes.cast(func, ctypes.c_void_p)
+            return func
+        except (ctypes.ArgumentError, TypeError):
+            pass
+    if low_level:
+        if type(func).__name__ == 'PyCapsule':
+            raise TypeError("LowLevelCallable backed by a PyCapsule (e.g. from_cython) cannot be "
+                            "evaluated; pass a numba @cfunc or a ctypes function double f(double)")
+        raise TypeError("LowLevelCallable must wrap a ctypes function double f(double)")
+    return None
+
+
+def _probe(func, a: float):
+    """
+    Resolve func to its C function pointer (if any) and evaluate it once at a.
+    
+    Returns:
+        Tuple of (func to call, C function pointer or None, f(a))
+    
+    Raises:
+        TypeError: If func is a LowLevelCallable that cannot be evaluated (see _c_function)
+        ValueError: If func cannot be evaluated at a
+    """
+    c_func = _c_function(func)
+    if c_func is not None:
+        func = c_func
+    
+    # Single probe: a function that cannot be evaluated at all is reported
+    # here; failures at later points propagate with their own type and traceback
+    try:
+        f_a = func(a)
+    except Exception as e:
+        raise ValueError(f"Error evaluating function at a={a}: {e}") from e
+    return func, c_func, f_a
+
+
+def _evaluate_probed(func, c_func, x_values, f_first=None, pool=None, n_workers: int = 1):
+    """
+    Evaluate an already probed func at every point of x_values.
+    
+    f_first is f(x_values[0]) when already known (it is then not evaluated
+    again); pool is the multiprocessing.Pool to map over, if any.
+    """
+    if pool is not None:
+        points = x_values.tolist() if f_first is None else x_values[1:].tolist()
+        chunksize = max(1, len(points) // (4 * n_workers))
+        f_values = pool.map(func, points, chunksize=chunksize)
+        if f_first is not None:
+            f_values = [f_first] + f_values
+        return np.array(f_values, dtype=np.float64)
+    
+    if NUMBA_AVAILABLE and (c_func is not None or isinstance(func, CPUDispatcher)):
+        return _grid_kernel(func, x_values)
+    
+    try:
+        with np.errstate(all="ignore"):
+            f_values = np.asarray(func(x_values), dtype=np.float64)
+        if f_values.shape == x_values.shape and np.all(np.isfinite(f_values)):
+            return f_values
+    except Exception:
+        pass
+    
+    # Scalar fallback: one call per point written straight into the array,
+    # no intermediate list of Python floats
+    if f_first is None:
+        return np.fromiter(map(func, x_values.tolist()), dtype=np.float64, count=len(x_values))
+    f_values = np.empty(len(x_values))
+    f_values[0] = f_first
+    f_values[1:] = np.fromiter(map(func, x_values[1:].tolist()), dtype=np.float64,
+                               count=len(x_values) - 1)
+    return f_values
+
+
+def evaluate_at(func, x_values, n_workers: int = 1):
+    """
+    Evaluate func at every point of a float64 array of grid points.
+    
+    The whole array is passed to func in one call first, so NumPy-aware
+    functions (e.g. built with sympy.lambdify) are evaluated in a single
+    vectorized pass. Scalar-only functions, functions returning the wrong
+    shape, and non-finite results fall back to point-by-point evaluation.
+    Functions decorated with numba's @njit are evaluated point by point
+    inside a compiled loop instead, and so are C integrands double f(double)
+    given as a numba @cfunc, a ctypes function or a scipy.LowLevelCallable
+    wrapping one (plain Python calls through ctypes when numba is not
+    installed).
+    
+    With n_workers > 1 the points are mapped over a multiprocessing.Pool,
+    which only pays off when a single evaluation is expensive. Each worker
+    is a separate process, so func must be picklable (a module-level def,
+    not a lambda or a closure).
+    
+    Parameters:
+        func: Function to evaluate
+        x_values: Grid points (float64 array, at least one point)
+        n_workers: Number of worker processes (1 = evaluate in this process)
+    
+    Returns:
+        float64 array of f(x) with the same length as x_values
+    
+    Raises:
+        TypeError: If func is a LowLevelCallable not wrapping a ctypes double f(double)
+        ValueError: If func cannot be evaluated at the first grid point
+    """
+    func, c_func, f_a = _probe(func, float(x_values[0]))
+    
+    if n_workers > 1:
+        with mp.Pool(n_workers) as pool:
+            return _evaluate_probed(func, c_func, x_values, f_a, pool, n_workers)
+    return _evaluate_probed(func, c_func, x_values, f_a)
+
+
+def evaluate_on_grid(func, a: float, b: float, n: int, n_workers: int = 1):
+    """
+    Evaluate func at the n + 1 grid points x_i = a + i*h (np.linspace(a, b, n + 1)).
+
+    See evaluate_at for how func is evaluated.
+
+    Parameters:
+        func: Function to evaluate
+        a: Lower bound
+        b: Upper bound
+        n: Number of intervals
+        n_workers: Number of worker processes (1 = evaluate in this process)
+
+    Returns:
+        Tuple of (x_values, f_values) as float64 arrays of length n + 1
+
+    Raises:
+        ValueError: If func cannot be evaluated at a
+    """
+    # linspace hits both endpoints exactly, no need to patch x_n = b
+    x_values = np.linspace(a, b, n + 1)
+    return x_values, evaluate_at(func, x_values, n_workers)
+
+
+# Grid points per tile in tiled_weighted_sum (512 KB of float64 per array)
+TILE = 1 << 16
+
+
+def tiled_weighted_sum(func, a: float, b: float, n: int, weights_for, n_workers: int = 1) -> float:
+    """
+    Σ w_i f(x_i) over the n + 1 grid points, evaluated one tile at a time.
+    
+    Only TILE grid points and their weights exist at any moment, so peak
+    memory stays O(TILE) instead of O(n) and the working set stays in cache.
+    Each tile holds exactly the points np.linspace(a, b, n + 1)[start:stop].
+    The products of all tiles are streamed into a single math.fsum, so the
+    sum is the same correctly rounded value as summing the full arrays.
+    func is probed once at a and, with n_workers > 1, one Pool serves all tiles.
+    
+    Parameters:
+        func: Function to evaluate (see evaluate_at)
+        a: Lower bound
+        b: Upper bound
+        n: Number of intervals
+        weights_for: Function mapping an int64 array of grid indices to their weights
+        n_workers: Number of worker processes (1 = evaluate in this process)
+    
+    Returns:
+        float: The weighted sum
+    
+    Raises:
+        ValueError: If func cannot be evaluated at a
+    """
+    func, c_func, f_a = _probe(func, float(a))
+    # Same arithmetic as np.linspace: arange(num) * ((b - a) / n) + a, last point = b
+    step = float(np.subtract(b, a, dtype=np.float64)) / n
+    
+    def tile_products(pool):
+        for start in range(0, n + 1, TILE):
+            idx = np.arange(start, min(start + TILE, n + 1))
+            x_values = idx.astype(np.float64)
+            x_values *= step
+            x_values += a
+            if idx[-1] == n:
+                x_values[-1] = b
+            f_first = f_a if start == 0 else None
+            f_values = _evaluate_probed(func, c_func, x_values, f_first, pool, n_workers)
+            yield (weights_for(idx) * f_values).tolist()
+    
+    if n_workers > 1:
+        with mp.Pool(n_workers) as pool:
+            return math.fsum(value for tile in tile_products(pool) for value in tile)
+    return math.fsum(value for tile in tile_products(None) for value in tile)
+
+
+# Accepted values of the rules' points_format argument
+POINTS_FORMATS = ('none', 'arrays', 'tuples')
+
+
+def points_entries(x_values, f_values, points_format: str) -> dict:
+    """
+    Result-dict entries describing the grid, in the requested format.
+
+    Parameters:
+        x_values: Grid points (float64 array)
+        f_values: Function values at the grid points (float64 array)
+        points_format: 'arrays' ('xs' and 'ys' arrays, the arrays already
+            computed, so no extra work), 'tuples' ('points' list of (x, f(x))
+            tuples, for callers that need the old layout) or 'none'
+
+    Returns:
+        Dictionary to merge into the rule's result
+    """
+    if points_format == 'arrays':
+        return {'xs': x_values, 'ys': f_values}
+    if points_format == 'tuples':
+        return {'points': list(zip(x_values.tolist(), f_values.tolist()))}
+    return {}
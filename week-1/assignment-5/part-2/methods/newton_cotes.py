@@ -0,0 +1,175 @@
+"""
+Composite Newton-Cotes core shared by the Trapezoidal and Simpson's rules.
+
+All three rules compute Σ wᵢ f(xᵢ) on the same uniform grid and only differ in
+the weight pattern, the scale factor and the constraint on n. The rule
+modules are thin wrappers that call _quadrature_newton_cotes with their tag:
+
+    'trap'    h    * [1/2, 1, 1, ..., 1, 1/2],       n >= 1
+    'simp13'  h/3  * [1, 4, 2, 4, ..., 2, 4, 1],     n even
+    'simp38'  3h/8 * [1, 3, 3, 2, ..., 2, 3, 3, 1],  n divisible by 3
+"""
+
+import math
+from functools import lru_cache
+
+import numpy as np
+
+from .grid import evaluate_on_grid, points_entries, tiled_weighted_sum, POINTS_FORMATS, TILE
+
+# Rule tag -> (number of intervals per panel, rule name used in error messages)
+_PANELS = {
+    'trap': (1, 'the trapezoidal rule'),
+    'simp13': (2, "Simpson's 1/3 rule"),
+    'simp38': (3, "Simpson's 3/8 rule"),
+}
+
+# Rule tag -> {diagnostic key: slice of f(x) summed for it}
+_DIAGNOSTICS = {
+    'trap': {},
+    'simp13': {
+        'sum_odd': slice(1, -1, 2),    # For x₁, x₃, x₅, ...
+        'sum_even': slice(2, -1, 2),   # For x₂, x₄, x₆, ...
+    },
+    'simp38': {
+        'sum1': slice(1, -1, 3),  # For indices where i % 3 == 1
+        'sum2': slice(2, -1, 3),  # For indices where i % 3 == 2
+        'sum3': slice(3, -1, 3),  # For indices where i % 3 == 0 (except 0 and n)
+    },
+}
+
+
+def _validate(rule: str, a: float, b: float, n: int):
+    """
+    Check n and the bounds for the given rule.
+    
+    Raises:
+        ValueError: If n is too small or not a multiple of the panel size, or a >= b
+    """
+    panel, name = _PANELS[rule]
+    if n < panel:
+        raise ValueError(f"Number of intervals must be at least {panel}")
+    if rule == 'simp13' and n % 2 != 0:
+        raise ValueError(f"Number of intervals must be even for {name}")
+    if rule == 'simp38' and n % 3 != 0:
+        raise ValueError(f"Number of intervals must be divisible by 3 for {name}")
+    if a >= b:
+        raise ValueError("Lower bound must be less than upper bound")
+
+
+def _scale(rule: str, h: float) -> float:
+    """
+    Factor multiplying the weighted sum: h, h/3 or 3h/8.
+    """
+    if rule == 'simp13':
+        return h / 3
+    if rule == 'simp38':
+        return 3 * h / 8
+    return h
+
+
+@lru_cache(maxsize=32)
+def _weights(rule: str, n: int) -> np.ndarray:
+    """
+    Unscaled weight vector of length n + 1 for the rule (cached per (rule, n), read-only).
+    """
+    # One allocation and a few strided writes, every entry written exactly once
+    w = np.empty(n + 1)
+    if rule == 'trap':
+        w[1:-1] = 1.0
+        w[0] = w[-1] = 0.5
+    elif rule == 'simp13':
+        w[1:-1:2] = 4.0
+        w[2:-1:2] = 2.0
+        w[0] = w[-1] = 1.0
+    else:
+        w[1:-1:3] = 3.0
+        w[2:-1:3] = 3.0
+        w[3:-1:3] = 2.0
+        w[0] = w[-1] = 1.0
+    w.flags.writeable = False
+    return w
+
+
+def _tile_weights(rule: str, idx: np.ndarray, n: int) -> np.ndarray:
+    """
+    Unscaled weights for the grid indices idx (one tile of the full vector).
+    """
+    if rule == 'trap':
+        return np.where((idx == 0) | (idx == n), 0.5, 1.0)
+    if rule == 'simp13':
+        w = np.where(idx % 2 == 1, 4.0, 2.0)
+    else:
+        w = np.where(idx % 3 == 0, 2.0, 3.0)
+    w[(idx == 0) | (idx == n)] = 1.0
+    return w
+
+
+def _quadrature_newton_cotes(func, a: float, b: float, n: int, rule: str, n_workers: int = 1,
+                             points_format: str = 'arrays', return_diagnostics: bool = False) -> dict:
+    """
+    Composite Newton-Cotes integral of func over [a, b] with n intervals.
+    
+    Parameters:
+        func: Function to integrate (see grid.evaluate_at)
+        a: Lower bound of integration
+        b: Upper bound of integration
+        n: Number of intervals
+        rule: 'trap', 'simp13' or 'simp38'
+        n_workers: Worker processes for evaluating func (func must be picklable if > 1)
+        points_format: 'arrays', 'tuples' or 'none' (see grid.points_entries)
+        return_diagnostics: Also return the rule's partial sums
+    
+    Returns:
+        Dictionary with 'result', 'a', 'b', 'n', 'h', 'function_evaluations',
+        the grid entries and the diagnostics (the wrappers add 'method' and 'formula')
+    
+    Raises:
+        ValueError: If the arguments are invalid for the rule, or func cannot be evaluated at a
+    """
+    _validate(rule, a, b, n)
+    if points_format not in POINTS_FORMATS:
+        raise ValueError(f"points_format must be one of {POINTS_FORMATS}")
+    
+    # Calculate step size
+    h = (b - a) / n
+    
+    if points_format == 'none' and not return_diagnostics and n + 1 > TILE:
+        # No per-point output requested: stream the grid tile by tile in O(TILE) memory
+        x_values = f_values = None
+        weighted_sum = tiled_weighted_sum(func, a, b, n, lambda idx: _tile_weights(rule, idx, n),
+                                          n_workers)
+    else:
+        # Evaluate f(x₀), ..., f(xₙ) in one pass
+        x_values, f_values = evaluate_on_grid(func, a, b, n, n_workers)
+        # One weighted sum (math.fsum, exact up to the final rounding)
+        weighted_sum = math.fsum((_weights(rule, n) * f_values).tolist())
+    
+    diagnostics = {}
+    if return_diagnostics:
+        # Partial sums, only computed on request
+        diagnostics = {key: math.fsum(f_values[part].tolist())
+                       for key, part in _DIAGNOSTICS[rule].items()}
+    
+    return {
+        'result': _scale(rule, h) * weighted_sum,
+        'a': a,
+        'b': b,
+        'n': n,
+        'h': h,
+        'function_evaluations': n + 1,
+        **points_entries(x_values, f_values, points_format),
+        **diagnostics,
+    }
+
+
+def _grid_and_weights(a: float, b: float, n: int, rule: str):
+    """
+    Grid points and scaled weights for the make_* integrator factories.
+    
+    Raises:
+        ValueError: If the arguments are invalid for the rule
+    """
+    _validate(rule, a, b, n)
+    h = (b - a) / n
+    return np.linspace(a, b, n + 1), _weights(rule, n) * _scale(rule, h)
@@ -9,73 +9,55 @@ where:
     x_even: x₂, x₄, x₆, ... (even indices)
 """
 
-import math
+import numpy as np
 
+from .grid import evaluate_at
+from .newton_cotes import _quadrature_newton_cotes, _grid_and_weights
 
-def simpson_one_third_rule(func, a: float, b: float, n: int) -> dict:
+
+def simpson_one_third_rule(func, a: float, b: float, n: int, n_workers: int = 1,
+                           points_format: str = 'arrays', return_diagnostics: bool = False) -> dict:
     """
     Calculate definite integral using Simpson's 1/3 Rule.
     
     Parameters:
-        func: Function to integrate (must be callable)
+        func: Function to integrate (callable, or a C double(double) function:
+              numba @cfunc, ctypes function or scipy.LowLevelCallable)
         a: Lower bound of integration
         b: Upper bound of integration
         n: Number of intervals (must be even)
+        n_workers: Worker processes for evaluating func (func must be picklable if > 1)
+        points_format: 'arrays' (default, adds 'xs'/'ys'), 'tuples' (adds 'points') or 'none'
+        return_diagnostics: Also return the partial sums 'sum_odd' and 'sum_even'
     """
-    # Validation
-    if n < 2:
-        raise ValueError("Number of intervals must be at least 2")
-    if n % 2 != 0:
-        raise ValueError("Number of intervals must be even for Simpson's 1/3 rule")
-    if a >= b:
-        raise ValueError("Lower bound must be less than upper bound")
-    
-    # Calculate step size
-    h = (b - a) / n
-    
-    # Initialize sums
-    sum_odd = 0.0   # For x₁, x₃, x₅, ...
-    sum_even = 0.0  # For x₂, x₄, x₆, ...
-    points = []
-    
-    try:
-        # Add f(a)
-        f_a = func(a)
-        points.append((a, f_a))
-        
-        # Calculate sum of odd and even indices
-        for i in range(1, n):
-            x_i = a + i * h
-            f_xi = func(x_i)
-            points.append((x_i, f_xi))
-            
-            if i % 2 == 1:  # Odd index
-                sum_odd += f_xi
-            else:  # Even index
-                sum_even += f_xi
-        
-        # Add f(b)
-        f_b = func(b)
-        points.append((b, f_b))
-        
-        # Calculate final result
-        # Formula: h/3 * [f(a) + 4*sum_odd + 2*sum_even + f(b)]
-        result = (h / 3) * (f_a + 4 * sum_odd + 2 * sum_even + f_b)
-        
-    except Exception as e:
-        raise ValueError(f"Error evaluating function: {str(e)}")
-    
+    result = _quadrature_newton_cotes(func, a, b, n, 'simp13', n_workers, points_format,
+                                      return_diagnostics)
+    h = result['h']
     return {
         'method': "Simpson's 1/3 Rule",
-        'result': result,
-        'a': a,
-        'b': b,
-        'n': n,
-        'h': h,
-        'function_evaluations': n + 1,
-        'points': points,
-        'sum_odd': sum_odd,
-        'sum_even': sum_even,
+        **result,
         'formula': f'∫[{a},{b}] f(x)dx ≈ {h}/3 * [f({a}) + 4*Σf(x_odd) + 2*Σf(x_even) + f({b})]'
     }
 
+
+def make_simpson_one_third(a: float, b: float, n: int):
+    """
+    Build a Simpson's 1/3 Rule integrator specialized for fixed a, b and n.
+    
+    The grid and the weights h/3*[1, 4, 2, ..., 2, 4, 1] are computed once, so
+    each call costs one evaluation of func on the grid and one dot product.
+    
+    Parameters:
+        a: Lower bound of integration
+        b: Upper bound of integration
+        n: Number of intervals (must be even)
+    
+    Returns:
+        Function integrate(func) -> float
+    """
+    x_values, weights = _grid_and_weights(a, b, n, 'simp13')
+    
+    def integrate(func) -> float:
+        return float(np.dot(weights, evaluate_at(func, x_values)))
+    
+    return integrate
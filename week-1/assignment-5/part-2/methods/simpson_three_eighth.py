@@ -15,76 +15,56 @@ where:
     k: indices where k mod 3 = 0 and k ≠ 0, n  (x₃, x₆, x₉, ...)
 """
 
-import math
+import numpy as np
 
+from .grid import evaluate_at
+from .newton_cotes import _quadrature_newton_cotes, _grid_and_weights
 
-def simpson_three_eighth_rule(func, a: float, b: float, n: int) -> dict:
+
+def simpson_three_eighth_rule(func, a: float, b: float, n: int, n_workers: int = 1,
+                              points_format: str = 'arrays', return_diagnostics: bool = False) -> dict:
     """
     Calculate definite integral using Simpson's 3/8 Rule.
     
     Parameters:
-        func: Function to integrate (must be callable)
+        func: Function to integrate (callable, or a C double(double) function:
+              numba @cfunc, ctypes function or scipy.LowLevelCallable)
         a: Lower bound of integration
         b: Upper bound of integration
         n: Number of intervals (must be divisible by 3)
+        n_workers: Worker processes for evaluating func (func must be picklable if > 1)
+        points_format: 'arrays' (default, adds 'xs'/'ys'), 'tuples' (adds 'points') or 'none'
+        return_diagnostics: Also return the group sums 'sum1', 'sum2', 'sum3'
     """
-    # Validation
-    if n < 3:
-        raise ValueError("Number of intervals must be at least 3")
-    if n % 3 != 0:
-        raise ValueError("Number of intervals must be divisible by 3 for Simpson's 3/8 rule")
-    if a >= b:
-        raise ValueError("Lower bound must be less than upper bound")
-    
-    # Calculate step size
-    h = (b - a) / n
-    
-    # Initialize sums
-    sum1 = 0.0  # For indices where i % 3 == 1
-    sum2 = 0.0  # For indices where i % 3 == 2
-    sum3 = 0.0  # For indices where i % 3 == 0 (except 0 and n)
-    points = []
-    
-    try:
-        # Add f(a)
-        f_a = func(a)
-        points.append((a, f_a))
-        
-        # Calculate sums for different groups
-        for i in range(1, n):
-            x_i = a + i * h
-            f_xi = func(x_i)
-            points.append((x_i, f_xi))
-            
-            if i % 3 == 1:
-                sum1 += f_xi
-            elif i % 3 == 2:
-                sum2 += f_xi
-            else:  # i % 3 == 0
-                sum3 += f_xi
-        
-        # Add f(b)
-        f_b = func(b)
-        points.append((b, f_b))
-        
-        # Calculate final result
-        # Formula: 3h/8 * [f(a) + 3*sum1 + 3*sum2 + 2*sum3 + f(b)]
-        result = (3 * h / 8) * (f_a + 3 * sum1 + 3 * sum2 + 2 * sum3 + f_b)
-        
-    except Exception as e:
-        raise ValueError(f"Error evaluating function: {str(e)}")
-    
+    result = _quadrature_newton_cotes(func, a, b, n, 'simp38', n_workers, points_format,
+                                      return_diagnostics)
+    h = result['h']
     return {
         'method': "Simpson's 3/8 Rule",
-        'result': result,
-        'a': a,
-        'b': b,
-        'n': n,
-        'h': h,
-        'function_evaluations': n + 1,
-        'points': points,
-        'sum1': sum1,
-        'sum2': sum2,
-        'sum3': sum3,
+        **result,
         'formula': f'∫[{a},{b}] f(x)dx ≈ 3*{h}/8 * [f({a}) + 3*Σf(x_i) + 3*Σf(x_j) + 2*Σf(x_k) + f({b})]'
     }
+
+
+def make_simpson_three_eighth(a: float, b: float, n: int):
+    """
+    Build a Simpson's 3/8 Rule integrator specialized for fixed a, b and n.
+    
+    The grid and the weights 3h/8*[1, 3, 3, 2, ..., 2, 3, 3, 1] are computed
+    once, so each call costs one evaluation of func on the grid and one dot
+    product.
+    
+    Parameters:
+        a: Lower bound of integration
+        b: Upper bound of integration
+        n: Number of intervals (must be divisible by 3)
+    
+    Returns:
+        Function integrate(func) -> float
+    """
+    x_values, weights = _grid_and_weights(a, b, n, 'simp38')
+    
+    def integrate(func) -> float:
+        return float(np.dot(weights, evaluate_at(func, x_values)))
+    
+    return integrate
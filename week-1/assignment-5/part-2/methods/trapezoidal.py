@@ -13,18 +13,25 @@ where:
     n = number of intervals
 """
 
-import math
+import numpy as np
 
+from .grid import evaluate_at
+from .newton_cotes import _quadrature_newton_cotes, _grid_and_weights
 
-def trapezoidal_rule(func, a: float, b: float, n: int) -> dict:
+
+def trapezoidal_rule(func, a: float, b: float, n: int, n_workers: int = 1,
+                     points_format: str = 'arrays') -> dict:
     """
     Calculate definite integral using the Trapezoidal Rule.
     
     Parameters:
-        func: Function to integrate (must be callable)
+        func: Function to integrate (callable, or a C double(double) function:
+              numba @cfunc, ctypes function or scipy.LowLevelCallable)
         a: Lower bound of integration
         b: Upper bound of integration
         n: Number of intervals (subintervals)
+        n_workers: Worker processes for evaluating func (func must be picklable if > 1)
+        points_format: 'arrays' (default, adds 'xs'/'ys'), 'tuples' (adds 'points') or 'none'
     
     Returns:
         Dictionary containing:
@@ -35,57 +42,43 @@ def trapezoidal_rule(func, a: float, b: float, n: int) -> dict:
             - 'n': Number of intervals
             - 'h': Step size
             - 'function_evaluations': Number of function evaluations
-            - 'points': List of (x, f(x)) values used in computation
+            - 'xs', 'ys': Grid points and f(x) values as float64 arrays (default)
+            - 'points': List of (x, f(x)) values (points_format='tuples')
     
     Raises:
-        ValueError: If n < 1 or a >= b
+        ValueError: If n < 1, a >= b, or func cannot be evaluated at a
     """
-    # Validation
-    if n < 1:
-        raise ValueError("Number of intervals must be at least 1")
-    if a >= b:
-        raise ValueError("Lower bound must be less than upper bound")
-    
-    # Calculate step size
-    h = (b - a) / n
-    
-    # Initialize sum with boundary terms
-    sum_value = 0.0
-    points = []
-    
-    try:
-        # Add f(a)
-        f_a = func(a)
-        points.append((a, f_a))
-        sum_value += f_a
-        
-        # Add 2 * Σf(xᵢ) for i = 1 to n-1
-        for i in range(1, n):
-            x_i = a + i * h
-            f_xi = func(x_i)
-            points.append((x_i, f_xi))
-            sum_value += 2 * f_xi
-        
-        # Add f(b)
-        f_b = func(b)
-        points.append((b, f_b))
-        sum_value += f_b
-        
-        # Calculate final result
-        result = (h / 2) * sum_value
-        
-    except Exception as e:
-        raise ValueError(f"Error evaluating function: {str(e)}")
-    
+    result = _quadrature_newton_cotes(func, a, b, n, 'trap', n_workers, points_format)
+    h = result['h']
     return {
         'method': 'Trapezoidal Rule',
-        'result': result,
-        'a': a,
-        'b': b,
-        'n': n,
-        'h': h,
-        'function_evaluations': n + 1,
-        'points': points,
+        **result,
         'formula': f'∫[{a},{b}] f(x)dx ≈ {h}/2 * [f({a}) + 2*Σf(xᵢ) + f({b})]'
     }
 
+
+def make_trapezoidal(a: float, b: float, n: int):
+    """
+    Build a Trapezoidal Rule integrator specialized for fixed a, b and n.
+    
+    The grid and the weights h*[1/2, 1, ..., 1, 1/2] are computed once, so each
+    call costs one evaluation of func on the grid and one dot product. Useful
+    when the same interval and n are used for many different functions.
+    
+    Parameters:
+        a: Lower bound of integration
+        b: Upper bound of integration
+        n: Number of intervals (subintervals)
+    
+    Returns:
+        Function integrate(func) -> float
+    
+    Raises:
+        ValueError: If n < 1 or a >= b
+    """
+    x_values, weights = _grid_and_weights(a, b, n, 'trap')
+    
+    def integrate(func) -> float:
+        return float(np.dot(weights, evaluate_at(func, x_values)))
+    
+    return integrate
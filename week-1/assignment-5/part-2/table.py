@@ -2,11 +2,65 @@
 Table display utilities for numerical integration results
 """
 
-try:
+import importlib.util
+import math
+import sys
+from functools import lru_cache
+
+import numpy as np
+
+from utils import calculate_error_metrics
+
+# tabulate is only imported when a table is first printed (see _tabulate)
+TABULATE_AVAILABLE = importlib.util.find_spec('tabulate') is not None
+
+# Separator lines, built once instead of on every print
+BAR80 = "=" * 80
+DASH80 = "-" * 80
+DASH60 = "-" * 60
+
+# Plain-text table headers used when tabulate is not installed
+_POINTS_HEADER = f"{'i':<5} {'x':<20} {'f(x)':<20}"
+_COMPARISON_HEADERS = ["Method", "n", "h (Step Size)", "Result", "Absolute Error", "Relative Error"]
+_COMPARISON_WIDTHS = [20, 10, 15, 20, 20, 20]
+# Fixed-width row template, e.g. "{:<20}{:<10}..."
+_COMPARISON_ROW = "".join(f"{{:<{w}}}" for w in _COMPARISON_WIDTHS)
+_COMPARISON_HEADER = _COMPARISON_ROW.format(*_COMPARISON_HEADERS)
+_COMPARISON_RULE = "-" * sum(_COMPARISON_WIDTHS)
+
+# Static screens, written with a single sys.stdout.write each
+_WELCOME = "\n".join([
+    f"\n{BAR80}",
+    " " * 25 + "NUMERICAL INTEGRATION",
+    " " * 25 + "Assignment 5 - Part 2",
+    BAR80,
+    "\nThis program implements three numerical integration methods:",
+    "  1. Trapezoidal Rule",
+    "  2. Simpson's 1/3 Rule",
+    "  3. Simpson's 3/8 Rule",
+    f"{BAR80}\n",
+]) + "\n"
+_MENU = "\n".join([
+    f"\n{DASH80}",
+    "SELECT AN OPTION:",
+    DASH80,
+    "  1. Trapezoidal Rule",
+    "  2. Simpson's 1/3 Rule",
+    "  3. Simpson's 3/8 Rule",
+    "  4. Compare All Methods",
+    "  5. Test Examples",
+    "  6. Method Information",
+    "  0. Exit",
+    DASH80,
+]) + "\n"
+
+
+def _tabulate(*args, **kwargs) -> str:
+    """
+    tabulate.tabulate, imported on first use so menu-only runs never load it.
+    """
     from tabulate import tabulate
-    TABULATE_AVAILABLE = True
-except ImportError:
-    TABULATE_AVAILABLE = False
+    return tabulate(*args, **kwargs)
 
 
 def display_integration_result(result: dict, show_points: bool = False):
@@ -17,10 +71,6 @@ def display_integration_result(result: dict, show_points: bool = False):
         result: Dictionary containing integration results
         show_points: Whether to display all computed points
     """
-    print("\n" + "="*80)
-    print(f"INTEGRATION RESULT: {result.get('method', 'Unknown Method')}")
-    print("="*80)
-    
     # Main results
     data = [
         ["Integral Value", f"{result.get('result', 'N/A'):.10f}"],
@@ -40,176 +90,222 @@ def display_integration_result(result: dict, show_points: bool = False):
     if 'relative_error' in result:
         data.append(["Relative Error", f"{result['relative_error']:.10e}"])
     
+    # Whole block collected and written at once instead of one print per line
+    lines = [f"\n{BAR80}", f"INTEGRATION RESULT: {result.get('method', 'Unknown Method')}", BAR80]
     if TABULATE_AVAILABLE:
-        print(tabulate(data, headers=["Parameter", "Value"], tablefmt="grid"))
+        lines.append(_tabulate(data, headers=["Parameter", "Value"], tablefmt="grid"))
     else:
-        for row in data:
-            print(f"{row[0]:<30} {row[1]}")
+        lines.extend(f"{row[0]:<30} {row[1]}" for row in data)
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Display points if requested
-    if show_points and 'points' in result:
-        display_computation_points(result['points'])
+    points = result_points(result)
+    if show_points and points is not None:
+        display_computation_points(points)
     
     print()
 
 
-def display_computation_points(points: list, max_display: int = 10):
+def result_points(result: dict):
+    """
+    Points stored in an integration result, or None if none were kept.
+    
+    Parameters:
+        result: Result dictionary from an integration method
+    
+    Returns:
+        List of (x, f(x)) tuples ('points') or a dict with the 'xs'/'ys' arrays
+        themselves (no copy is made)
+    """
+    if 'points' in result:
+        return result['points']
+    if 'xs' in result and 'ys' in result:
+        return {'xs': result['xs'], 'ys': result['ys']}
+    return None
+
+
+def display_computation_points(points, max_display: int = 10):
     """
     Display the points used in computation.
     
     Parameters:
-        points: List of (x, f(x)) tuples
+        points: List of (x, f(x)) tuples, an (n, 2) array of rows (x, f(x)),
+            or a dict of 'xs' and 'ys' arrays (only the displayed entries are read)
         max_display: Maximum number of points to display
     """
-    print("\n" + "-"*60)
-    print("COMPUTATION POINTS")
-    print("-"*60)
+    lines = [f"\n{DASH60}", "COMPUTATION POINTS", DASH60]
+    
+    # Column views of array inputs; a list of tuples is read entry by entry
+    if isinstance(points, dict):
+        xs, ys = np.asarray(points['xs']), np.asarray(points['ys'])
+    elif isinstance(points, np.ndarray):
+        xs, ys = points[:, 0], points[:, 1]
+    else:
+        xs = ys = None
+    total = len(points) if xs is None else len(xs)
+    
+    # First and last max_display//2 points (all of them if there are few),
+    # labelled with their index in the grid
+    if total > max_display:
+        half = max_display // 2
+        shown = [*range(half), *range(total - half, total)]
+    else:
+        half = None
+        shown = list(range(total))
     
-    if len(points) > max_display:
-        display_points = points[:max_display//2] + [('...', '...')] + points[-max_display//2:]
+    # Format the shown values: one np.char.mod call per column for arrays
+    if xs is not None:
+        x_strs = np.char.mod('%.6f', xs[shown]).tolist()
+        f_strs = np.char.mod('%.6f', ys[shown]).tolist()
     else:
-        display_points = points
+        x_strs = [f"{points[i][0]:.6f}" for i in shown]
+        f_strs = [f"{points[i][1]:.6f}" for i in shown]
+    rows = list(zip(shown, x_strs, f_strs))
+    if half is not None:
+        rows.insert(half, ('...', '...', '...'))
     
     if TABULATE_AVAILABLE:
-        headers = ["i", "x", "f(x)"]
-        table_data = []
-        for i, (x, fx) in enumerate(display_points):
-            if x == '...':
-                table_data.append(['...', '...', '...'])
-            else:
-                table_data.append([i, f"{x:.6f}", f"{fx:.6f}"])
-        print(tabulate(table_data, headers=headers, tablefmt="grid"))
+        lines.append(_tabulate(rows, headers=["i", "x", "f(x)"], tablefmt="grid"))
     else:
-        print(f"{'i':<5} {'x':<20} {'f(x)':<20}")
-        print("-" * 60)
-        for i, (x, fx) in enumerate(display_points):
-            if x == '...':
-                print(f"{'...':<5} {'...':<20} {'...':<20}")
-            else:
-                print(f"{i:<5} {x:<20.6f} {fx:<20.6f}")
+        lines += [_POINTS_HEADER, DASH60]
+        lines.extend(f"{i:<5} {x:<20} {fx:<20}" for i, x, fx in rows)
     
-    if len(points) > max_display:
-        print(f"\n(Showing {max_display} of {len(points)} points)")
+    if total > max_display:
+        lines.append(f"\n(Showing {max_display} of {total} points)")
     
-    print()
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def display_comparison(results: dict):
+def comparison_rows(results: dict) -> list:
     """
-    Display comparison of multiple integration methods.
+    Normalized per-method rows of a compare_methods result.
+    
+    Results and step sizes are gathered once into float arrays (NaN where
+    missing, e.g. for methods that failed), so the rows can be rendered without
+    per-cell type checks. The errors are the ones compare_methods stored in
+    each result; if some are missing they are computed for all methods with
+    calculate_error_metrics, the single definition of both errors.
     
     Parameters:
         results: Dictionary mapping method names to result dictionaries
+    
+    Returns:
+        List of dicts with 'method', 'n', 'h', 'result', 'error',
+        'relative_error' (NaN without an exact value) and 'message'
+        (the error message of a method that failed, else None)
     """
-    print("\n" + "="*80)
-    print("SUMMARY TABLE")
-    print("="*80)
+    exact_value = results.get('exact_value')
+    entries = [(name, result) for name, result in results.items() if name != 'exact_value']
+    
+    values = np.array([result.get('result', np.nan) for _, result in entries], dtype=np.float64)
+    steps = np.array([result.get('h', np.nan) for _, result in entries], dtype=np.float64)
+    
+    computed = [result for _, result in entries if 'result' in result]
+    if exact_value is None:
+        abs_errors = rel_errors = [math.nan] * len(entries)
+    elif all('relative_error' in result for result in computed):
+        abs_errors = [result['error'] if 'result' in result else math.nan for _, result in entries]
+        rel_errors = [result['relative_error'] if 'result' in result else math.nan
+                      for _, result in entries]
+    else:
+        metrics = calculate_error_metrics(values, exact_value)
+        abs_errors = metrics['absolute_error'].tolist()
+        rel_errors = metrics['relative_error'].tolist()
+    
+    return [
+        {
+            'method': method_name,
+            'n': result.get('n', 'N/A'),
+            'h': h,
+            'result': value,
+            'error': error,
+            'relative_error': rel_error,
+            'message': result['error'] if isinstance(result.get('error'), str) else None,
+        }
+        for (method_name, result), h, value, error, rel_error
+        in zip(entries, steps.tolist(), values.tolist(), abs_errors, rel_errors)
+    ]
+
+
+def display_comparison(results: dict, rows: list = None):
+    """
+    Display comparison of multiple integration methods.
     
+    Parameters:
+        results: Dictionary mapping method names to result dictionaries
+        rows: comparison_rows(results), if the caller already computed them
+    """
+    if rows is None:
+        rows = comparison_rows(results)
     exact_value = results.get('exact_value')
     
+    lines = [f"\n{BAR80}", "SUMMARY TABLE", BAR80]
+    
     comparison_data = []
-    for method_name, result in results.items():
-        if method_name == 'exact_value':
-            continue
-        
-        if 'error' in result and isinstance(result['error'], str):
-            comparison_data.append([
-                method_name,
-                "Error",
-                "-",
-                result['error'],
-                "-",
-                "-"
-            ])
+    for row in rows:
+        if row['message'] is not None:
+            comparison_data.append([row['method'], "Error", "-", row['message'], "-", "-"])
+        elif math.isnan(row['error']):
+            comparison_data.append([row['method'], str(row['n']), f"{row['h']:.6f}",
+                                    f"{row['result']:.10f}", "-", "-"])
         else:
-            n = result.get('n', 'N/A')
-            h = result.get('h', 'N/A')
-            res = result.get('result', 0)
-            
-            # Format h and result
-            h_str = f"{h:.6f}" if isinstance(h, (int, float)) and h != 'N/A' else str(h)
-            res_str = f"{res:.10f}" if isinstance(res, (int, float)) else str(res)
-            
-            row = [
-                method_name,
-                str(n),
-                h_str,
-                res_str,
-            ]
-            
-            if exact_value is not None and 'result' in result:
-                error = abs(result['result'] - exact_value)
-                rel_error = error / abs(exact_value) if exact_value != 0 else float('inf')
-                row.append(f"{error:.10e}")
-                row.append(f"{rel_error:.10e}")
-            else:
-                row.append("-")
-                row.append("-")
-            
-            comparison_data.append(row)
-    
-    headers = ["Method", "n", "h (Step Size)", "Result", "Absolute Error", "Relative Error"]
+            comparison_data.append([row['method'], str(row['n']), f"{row['h']:.6f}",
+                                    f"{row['result']:.10f}", f"{row['error']:.10e}",
+                                    f"{row['relative_error']:.10e}"])
     
     if TABULATE_AVAILABLE:
-        print(tabulate(comparison_data, headers=headers, tablefmt="grid"))
+        lines.append(_tabulate(comparison_data, headers=_COMPARISON_HEADERS, tablefmt="grid"))
     else:
-        # Print headers
-        col_widths = [20, 10, 15, 20, 20, 20]
-        header_line = "".join(h.ljust(w) for h, w in zip(headers, col_widths))
-        print(header_line)
-        print("-" * sum(col_widths))
-        
-        # Print data
-        for row in comparison_data:
-            line = "".join(str(val).ljust(w) for val, w in zip(row, col_widths))
-            print(line)
+        # Headers, then one line per row
+        lines += [_COMPARISON_HEADER, _COMPARISON_RULE]
+        lines.extend(_COMPARISON_ROW.format(*row) for row in comparison_data)
     
     if exact_value is not None:
-        print(f"\nExact Value: {exact_value:.10f}")
+        lines.append(f"\nExact Value: {exact_value:.10f}")
     
-    print()
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def display_method_info(method_name: str):
+# Description of each integration method shown by display_method_info
+_METHOD_INFO = {
+    'trapezoidal': {
+        'name': 'Trapezoidal Rule',
+        'formula': '∫[a,b] f(x)dx ≈ h/2 * [f(a) + 2*Σf(xᵢ) + f(b)]',
+        'requirements': 'n ≥ 1',
+        'error': 'O(h²) or O(1/n²)',
+        'best_for': 'Linear functions, quick approximations'
+    },
+    'simpson_1/3': {
+        'name': "Simpson's 1/3 Rule",
+        'formula': '∫[a,b] f(x)dx ≈ h/3 * [f(a) + 4*Σf(x_odd) + 2*Σf(x_even) + f(b)]',
+        'requirements': 'n must be even, n ≥ 2',
+        'error': 'O(h⁴) or O(1/n⁴)',
+        'best_for': 'Smooth functions, quadratic approximations'
+    },
+    'simpson_3/8': {
+        'name': "Simpson's 3/8 Rule",
+        'formula': '∫[a,b] f(x)dx ≈ 3h/8 * [f(a) + 3*Σf(x_i) + 3*Σf(x_j) + 2*Σf(x_k) + f(b)]',
+        'requirements': 'n must be divisible by 3, n ≥ 3',
+        'error': 'O(h⁴) or O(1/n⁴)',
+        'best_for': 'Smooth functions, cubic approximations'
+    }
+}
+
+
+@lru_cache(maxsize=8)
+def _render_method_info(method_name: str) -> str:
     """
-    Display information about a specific integration method.
+    Formatted information table for a method (rendered once per method).
     
     Parameters:
-        method_name: Name of the method
-    """
-    info = {
-        'trapezoidal': {
-            'name': 'Trapezoidal Rule',
-            'formula': '∫[a,b] f(x)dx ≈ h/2 * [f(a) + 2*Σf(xᵢ) + f(b)]',
-            'requirements': 'n ≥ 1',
-            'error': 'O(h²) or O(1/n²)',
-            'best_for': 'Linear functions, quick approximations'
-        },
-        'simpson_1/3': {
-            'name': "Simpson's 1/3 Rule",
-            'formula': '∫[a,b] f(x)dx ≈ h/3 * [f(a) + 4*Σf(x_odd) + 2*Σf(x_even) + f(b)]',
-            'requirements': 'n must be even, n ≥ 2',
-            'error': 'O(h⁴) or O(1/n⁴)',
-            'best_for': 'Smooth functions, quadratic approximations'
-        },
-        'simpson_3/8': {
-            'name': "Simpson's 3/8 Rule",
-            'formula': '∫[a,b] f(x)dx ≈ 3h/8 * [f(a) + 3*Σf(x_i) + 3*Σf(x_j) + 2*Σf(x_k) + f(b)]',
-            'requirements': 'n must be divisible by 3, n ≥ 3',
-            'error': 'O(h⁴) or O(1/n⁴)',
-            'best_for': 'Smooth functions, cubic approximations'
-        }
-    }
-    
-    if method_name not in info:
-        print(f"Unknown method: {method_name}")
-        return
+        method_name: Key of _METHOD_INFO
     
-    method_info = info[method_name]
-    
-    print("\n" + "="*80)
-    print(f"METHOD INFORMATION: {method_info['name']}")
-    print("="*80)
+    Returns:
+        The text printed by display_method_info
+    """
+    method_info = _METHOD_INFO[method_name]
     
     data = [
         ["Formula", method_info['formula']],
@@ -218,14 +314,29 @@ def display_method_info(method_name: str):
         ["Best For", method_info['best_for']]
     ]
     
+    lines = [f"\n{BAR80}", f"METHOD INFORMATION: {method_info['name']}", BAR80]
     if TABULATE_AVAILABLE:
-        print(tabulate(data, tablefmt="grid"))
+        lines.append(_tabulate(data, tablefmt="grid"))
     else:
         for key, value in data:
-            print(f"\n{key}:")
-            print(f"  {value}")
+            lines.append(f"\n{key}:")
+            lines.append(f"  {value}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def display_method_info(method_name: str):
+    """
+    Display information about a specific integration method.
     
-    print()
+    Parameters:
+        method_name: Name of the method
+    """
+    if method_name not in _METHOD_INFO:
+        print(f"Unknown method: {method_name}")
+        return
+    
+    print(_render_method_info(method_name))
 
 
 def display_error_analysis(approximate: float, exact: float):
@@ -236,13 +347,9 @@ def display_error_analysis(approximate: float, exact: float):
         approximate: Approximate value
         exact: Exact value
     """
-    from utils import calculate_error_metrics
-    
     metrics = calculate_error_metrics(approximate, exact)
     
-    print("\n" + "="*80)
-    print("ERROR ANALYSIS")
-    print("="*80)
+    lines = [f"\n{BAR80}", "ERROR ANALYSIS", BAR80]
     
     data = [
         ["Approximate Value", f"{approximate:.15f}"],
@@ -254,37 +361,20 @@ def display_error_analysis(approximate: float, exact: float):
     ]
     
     if TABULATE_AVAILABLE:
-        print(tabulate(data, headers=["Metric", "Value"], tablefmt="grid"))
+        lines.append(_tabulate(data, headers=["Metric", "Value"], tablefmt="grid"))
     else:
         for row in data:
-            print(f"{row[0]:<25} {row[1]}")
+            lines.append(f"{row[0]:<25} {row[1]}")
     
-    print()
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def display_welcome():
     """Display welcome message."""
-    print("\n" + "="*80)
-    print(" "*25 + "NUMERICAL INTEGRATION")
-    print(" "*25 + "Assignment 5 - Part 2")
-    print("="*80)
-    print("\nThis program implements three numerical integration methods:")
-    print("  1. Trapezoidal Rule")
-    print("  2. Simpson's 1/3 Rule")
-    print("  3. Simpson's 3/8 Rule")
-    print("="*80 + "\n")
+    sys.stdout.write(_WELCOME)
 
 
 def display_menu():
     """Display main menu."""
-    print("\n" + "-"*80)
-    print("SELECT AN OPTION:")
-    print("-"*80)
-    print("  1. Trapezoidal Rule")
-    print("  2. Simpson's 1/3 Rule")
-    print("  3. Simpson's 3/8 Rule")
-    print("  4. Compare All Methods")
-    print("  5. Test Examples")
-    print("  6. Method Information")
-    print("  0. Exit")
-    print("-"*80)
+    sys.stdout.write(_MENU)
@@ -10,6 +10,7 @@ from methods.trapezoidal import trapezoidal_rule
 from methods.simpson_one_third import simpson_one_third_rule
 from methods.simpson_three_eighth import simpson_three_eighth_rule
 from utils import compare_methods
+from table import comparison_rows, display_comparison
 
 # Test function: sin(x) from 0 to π
 func = math.sin
@@ -24,8 +25,9 @@ print(f"\nFunction: sin(x)")
 print(f"Interval: [{a}, {b}]")
 print(f"Exact value: {exact_value}")
 
-# Get results
+# Get results, normalized once for both the detailed section and the table
 results = compare_methods(func, a, b, exact_value)
+rows = {row['method']: row for row in comparison_rows(results)}
 
 # Display detailed results for each method
 print("\n" + "="*80)
@@ -36,27 +38,26 @@ method_order = [('trapezoidal', 'TRAPEZOIDAL RULE', 'n ≥ 1'),
                 ('simpson_1/3', "SIMPSON'S 1/3 RULE", 'n must be even'),
                 ('simpson_3/8', "SIMPSON'S 3/8 RULE", 'n must be divisible by 3')]
 
+# One template per block, the whole section is printed at once
+DETAIL = "\n{i}. {name} (n={n}, {constraint}):\n   h = {h:.10f}\n   Result = {result:.10f}"
+DETAIL_ERROR = "\n   Error = {error:.10e}"
+FAILED = "\n{i}. {name} - ERROR\n   {message}"
+
+blocks = []
 for i, (method_key, method_name, constraint) in enumerate(method_order, 1):
-    if method_key in results:
-        result = results[method_key]
-        if 'error' in result and isinstance(result['error'], str):
-            print(f"\n{i}. {method_name} - ERROR")
-            print(f"   {result['error']}")
-        else:
-            n = result.get('n', 'N/A')
-            h = result.get('h', 0)
-            value = result.get('result', 0)
-            
-            print(f"\n{i}. {method_name} (n={n}, {constraint}):")
-            print(f"   h = {h:.10f}")
-            print(f"   Result = {value:.10f}")
-            
-            if exact_value is not None:
-                error = abs(value - exact_value)
-                print(f"   Error = {error:.10e}")
+    row = rows.get(method_key)
+    if row is None:
+        continue
+    if row['message'] is not None:
+        blocks.append(FAILED.format(i=i, name=method_name, message=row['message']))
+        continue
+    block = DETAIL.format(i=i, name=method_name, constraint=constraint, **row)
+    if exact_value is not None:
+        block += DETAIL_ERROR.format(**row)
+    blocks.append(block)
+print("\n".join(blocks))
 
 # Display comparison table
-from table import display_comparison
-display_comparison(results)
+display_comparison(results, list(rows.values()))
 
 print("\n✓ Comparison feature working correctly!")
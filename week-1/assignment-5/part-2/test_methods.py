@@ -0,0 +1,191 @@
+"""
+Test the return contracts of the integration methods and the grid evaluation
+"""
+
+import contextlib
+import ctypes
+import io
+import math
+
+import numpy as np
+
+from methods.trapezoidal import trapezoidal_rule, make_trapezoidal
+from methods.simpson_one_third import simpson_one_third_rule, make_simpson_one_third
+from methods.simpson_three_eighth import simpson_three_eighth_rule, make_simpson_three_eighth
+from methods.newton_cotes import _weights, _tile_weights
+from methods.grid import evaluate_at, evaluate_on_grid, TILE
+from table import result_points, display_computation_points, display_integration_result
+
+try:
+    from scipy import LowLevelCallable
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+# (rule, factory, n accepted by the rule, n rejected by the rule)
+RULES = [(trapezoidal_rule, make_trapezoidal, 6, 0),
+         (simpson_one_third_rule, make_simpson_one_third, 6, 5),
+         (simpson_three_eighth_rule, make_simpson_three_eighth, 6, 4)]
+
+
+def cubic(x):
+    return x**3 - 2*x + 1
+
+
+def scalar_only(x):
+    """math.exp rejects arrays, so evaluation falls back to one call per point"""
+    return math.exp(x)
+
+
+def _raises(exception, func, *args, **kwargs):
+    """True if func(*args, **kwargs) raises exception"""
+    try:
+        func(*args, **kwargs)
+    except exception:
+        return True
+    return False
+
+
+def _captured(display, *args):
+    """stdout written by display(*args)"""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        display(*args)
+    return buffer.getvalue()
+
+
+def test_points_formats():
+    for rule, _, n, _ in RULES:
+        default = rule(cubic, 0.0, 1.5, n)
+        assert 'points' not in default
+        assert np.array_equal(default['xs'], np.linspace(0.0, 1.5, n + 1))
+        assert np.array_equal(default['ys'], cubic(default['xs']))
+
+        tuples = rule(cubic, 0.0, 1.5, n, points_format='tuples')
+        assert 'xs' not in tuples and 'ys' not in tuples
+        assert tuples['points'] == list(zip(default['xs'].tolist(), default['ys'].tolist()))
+
+        none = rule(cubic, 0.0, 1.5, n, points_format='none')
+        assert not {'xs', 'ys', 'points'} & none.keys()
+
+        # The format only changes how the grid is returned, never the integral
+        assert default['result'] == tuples['result'] == none['result']
+        assert default['function_evaluations'] == n + 1
+
+        assert _raises(ValueError, rule, cubic, 0.0, 1.5, n, points_format='list')
+
+
+def test_exactness_and_validation():
+    # Trapezoidal is exact for straight lines, both Simpson rules for cubics
+    assert math.isclose(trapezoidal_rule(lambda x: 3*x + 1, 0, 2, 5)['result'], 8.0)
+    exact = 1.5**4 / 4 - 1.5**2 + 1.5
+    for rule, _, n, _ in RULES[1:]:
+        assert math.isclose(rule(cubic, 0.0, 1.5, n)['result'], exact, rel_tol=1e-12)
+
+    for rule, _, n, bad_n in RULES:
+        for args in ((0.0, 1.0, bad_n), (1.0, 1.0, n), (2.0, 1.0, n)):
+            assert _raises(ValueError, rule, cubic, *args), f"{rule.__name__} accepted {args}"
+
+
+def test_diagnostics():
+    f = np.cos
+    n = 12
+    ys = f(np.linspace(0.0, 2.0, n + 1))
+    h = 2.0 / n
+
+    assert 'sum_odd' not in simpson_one_third_rule(f, 0.0, 2.0, n)
+    simp13 = simpson_one_third_rule(f, 0.0, 2.0, n, return_diagnostics=True)
+    assert math.isclose(simp13['sum_odd'], ys[1:-1:2].sum())
+    assert math.isclose(simp13['sum_even'], ys[2:-1:2].sum())
+    assert math.isclose(simp13['result'],
+                        h / 3 * (ys[0] + 4*simp13['sum_odd'] + 2*simp13['sum_even'] + ys[-1]))
+
+    assert 'sum1' not in simpson_three_eighth_rule(f, 0.0, 2.0, n)
+    simp38 = simpson_three_eighth_rule(f, 0.0, 2.0, n, return_diagnostics=True)
+    for key, start in (('sum1', 1), ('sum2', 2), ('sum3', 3)):
+        assert math.isclose(simp38[key], ys[start:-1:3].sum())
+    assert math.isclose(simp38['result'],
+                        3*h / 8 * (ys[0] + 3*simp38['sum1'] + 3*simp38['sum2']
+                                   + 2*simp38['sum3'] + ys[-1]))
+
+
+def test_weights():
+    assert _weights('trap', 4).tolist() == [0.5, 1, 1, 1, 0.5]
+    assert _weights('simp13', 6).tolist() == [1, 4, 2, 4, 2, 4, 1]
+    assert _weights('simp38', 6).tolist() == [1, 3, 3, 2, 3, 3, 1]
+    assert not _weights('trap', 4).flags.writeable
+
+    # Tiles of indices reproduce the full weight vector
+    n = 30
+    for rule in ('trap', 'simp13', 'simp38'):
+        tiles = [_tile_weights(rule, np.arange(start, min(start + 7, n + 1)), n)
+                 for start in range(0, n + 1, 7)]
+        assert np.array_equal(np.concatenate(tiles), _weights(rule, n))
+
+
+def test_tiled_sum_matches_full_grid():
+    # points_format='none' above TILE points streams the grid tile by tile
+    n = 3 * TILE
+    for rule, _, _, _ in RULES:
+        full = rule(np.sin, 0.0, 3.0, n)
+        tiled = rule(np.sin, 0.0, 3.0, n, points_format='none')
+        assert tiled['result'] == full['result']
+
+
+def test_factories_match_rules():
+    for rule, factory, n, _ in RULES:
+        integrate = factory(-1.0, 2.0, n)
+        assert math.isclose(integrate(cubic), rule(cubic, -1.0, 2.0, n)['result'], rel_tol=1e-12)
+
+
+def test_grid_evaluation():
+    x_values, f_values = evaluate_on_grid(scalar_only, 0.0, 1.0, 8)
+    assert np.array_equal(x_values, np.linspace(0.0, 1.0, 9))
+    assert np.allclose(f_values, np.exp(x_values))
+
+    # A function failing at the first grid point is reported as ValueError
+    assert _raises(ValueError, evaluate_at, lambda x: 1 / x, np.linspace(0.0, 1.0, 5))
+
+    # C integrand double f(double) given as a ctypes function
+    c_square = ctypes.CFUNCTYPE(ctypes.c_double, ctypes.c_double)(lambda x: x * x)
+    assert math.isclose(simpson_one_third_rule(c_square, 0.0, 3.0, 6)['result'], 9.0)
+
+    if SCIPY_AVAILABLE:
+        assert math.isclose(trapezoidal_rule(LowLevelCallable(c_square), 0.0, 1.0, 4)['result'],
+                            trapezoidal_rule(lambda x: x * x, 0.0, 1.0, 4)['result'])
+
+        # A PyCapsule cannot be called from Python and is rejected up front
+        capsule_new = ctypes.pythonapi.PyCapsule_New
+        capsule_new.restype = ctypes.py_object
+        capsule_new.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p]
+        address = ctypes.cast(c_square, ctypes.c_void_p).value
+        capsule = LowLevelCallable(capsule_new(address, b"double (double)", None))
+        assert _raises(TypeError, trapezoidal_rule, capsule, 0.0, 1.0, 4)
+
+
+def test_result_points_display():
+    arrays = trapezoidal_rule(cubic, 0.0, 2.0, 20)
+    tuples = trapezoidal_rule(cubic, 0.0, 2.0, 20, points_format='tuples')
+    none = trapezoidal_rule(cubic, 0.0, 2.0, 20, points_format='none')
+
+    points = result_points(arrays)
+    assert points['xs'] is arrays['xs'] and points['ys'] is arrays['ys']
+    assert result_points(tuples) is tuples['points']
+    assert result_points(none) is None
+
+    # The xs/ys arrays display exactly like the old list of tuples
+    for max_display in (10, 30):
+        assert (_captured(display_computation_points, points, max_display)
+                == _captured(display_computation_points, tuples['points'], max_display))
+    assert (_captured(display_integration_result, arrays, True)
+            == _captured(display_integration_result, tuples, True))
+
+
+if __name__ == "__main__":
+    tests = [test_points_formats, test_exactness_and_validation, test_diagnostics, test_weights,
+             test_tiled_sum_matches_full_grid, test_factories_match_rules, test_grid_evaluation,
+             test_result_points_display]
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+    print(f"\n✓ All {len(tests)} method tests passed!")
@@ -3,8 +3,12 @@ Utility functions for numerical integration
 """
 
 import math
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Callable, Tuple
 
+import numpy as np
+
 
 def validate_integration_params(a: float, b: float, n: int, 
                                  divisibility: int = None) -> None:
@@ -57,6 +61,11 @@ def compare_methods(func: Callable, a: float, b: float,
     """
     Compare different numerical integration methods on the same function.
     
+    Comparisons of the common test functions (see get_common_test_functions)
+    are cached per (function, a, b, exact_value, n), so re-running the same
+    comparison returns without integrating again. Other functions, e.g.
+    lambdas built from user input, are always computed.
+    
     Parameters:
         func: Function to integrate
         a: Lower bound
@@ -67,6 +76,40 @@ def compare_methods(func: Callable, a: float, b: float,
     Returns:
         Dictionary with comparison results
     """
+    try:
+        name = _TEST_FUNCTION_NAMES.get(func)
+    except TypeError:
+        name = None  # Unhashable callable: never one of the test functions
+    if name is None:
+        return _compare_methods(func, a, b, exact_value, n)
+    
+    # Copy the per-method dicts so callers cannot modify the cached results
+    # (their arrays are read-only)
+    cached = _compare_test_function(name, a, b, exact_value, n)
+    return {key: dict(value) if isinstance(value, dict) else value
+            for key, value in cached.items()}
+
+
+@lru_cache(maxsize=64)
+def _compare_test_function(name: str, a: float, b: float, exact_value: float, n: int) -> dict:
+    """
+    compare_methods for the common test function called name (cached).
+    The grid arrays ('xs', 'ys') of the cached results are made read-only,
+    since every later call returns the same arrays.
+    """
+    results = _compare_methods(_TEST_FUNCTIONS[name][0], a, b, exact_value, n)
+    for result in results.values():
+        if isinstance(result, dict):
+            for value in result.values():
+                if isinstance(value, np.ndarray):
+                    value.flags.writeable = False
+    return results
+
+
+def _compare_methods(func: Callable, a: float, b: float, exact_value: float, n: int) -> dict:
+    """
+    Uncached implementation of compare_methods.
+    """
     from methods.trapezoidal import trapezoidal_rule
     from methods.simpson_one_third import simpson_one_third_rule
     from methods.simpson_three_eighth import simpson_three_eighth_rule
@@ -84,95 +127,112 @@ def compare_methods(func: Callable, a: float, b: float,
         # For simpson_3/8, adjust n to be divisible by 3
         n_simp38 = n + (3 - n % 3) % 3
     
-    try:
-        results['trapezoidal'] = trapezoidal_rule(func, a, b, n_trap)
-    except Exception as e:
-        results['trapezoidal'] = {'error': str(e)}
+    # Each method is integrated exactly once; callers and display_comparison
+    # read the returned dicts instead of re-running the rules
+    methods = [('trapezoidal', trapezoidal_rule, n_trap),
+               ('simpson_1/3', simpson_one_third_rule, n_simp13),
+               ('simpson_3/8', simpson_three_eighth_rule, n_simp38)]
     
-    try:
-        results['simpson_1/3'] = simpson_one_third_rule(func, a, b, n_simp13)
-    except Exception as e:
-        results['simpson_1/3'] = {'error': str(e)}
+    # The rules share no state, so they run concurrently; NumPy-vectorized
+    # evaluation releases the GIL, plain Python integrands simply interleave
+    futures = {}
+    with ThreadPoolExecutor(max_workers=len(methods)) as executor:
+        for method_key, rule, method_n in methods:
+            futures[method_key] = executor.submit(rule, func, a, b, method_n)
     
-    try:
-        results['simpson_3/8'] = simpson_three_eighth_rule(func, a, b, n_simp38)
-    except Exception as e:
-        results['simpson_3/8'] = {'error': str(e)}
+    for method_key, future in futures.items():
+        try:
+            results[method_key] = future.result()
+        except Exception as e:
+            results[method_key] = {'error': str(e)}
     
-    # Calculate errors if exact value is provided
-    if exact_value is not None:
-        for method_name, result in results.items():
-            if 'result' in result:
-                result['error'] = abs(result['result'] - exact_value)
-                result['relative_error'] = abs(result['error'] / exact_value) if exact_value != 0 else float('inf')
+    # Calculate errors if exact value is provided, for all methods in one vectorized pass
+    computed = [result for result in results.values() if 'result' in result]
+    if exact_value is not None and computed:
+        metrics = calculate_error_metrics([result['result'] for result in computed], exact_value)
+        for result, error, relative_error in zip(computed, metrics['absolute_error'].tolist(),
+                                                 metrics['relative_error'].tolist()):
+            result['error'] = error
+            result['relative_error'] = relative_error
     
     results['exact_value'] = exact_value
     
     return results
 
 
+# Common test functions with their exact integrals, built once at import:
+# name -> (function, a, b, exact_value, description)
+_TEST_FUNCTIONS = {
+    'polynomial_x2': (
+        lambda x: x**2,
+        0, 1,
+        1/3,
+        "∫[0,1] x² dx = 1/3"
+    ),
+    'polynomial_x3': (
+        lambda x: x**3,
+        0, 2,
+        4,
+        "∫[0,2] x³ dx = 4"
+    ),
+    'sin': (
+        math.sin,
+        0, math.pi,
+        2,
+        "∫[0,π] sin(x) dx = 2"
+    ),
+    'cos': (
+        math.cos,
+        0, math.pi/2,
+        1,
+        "∫[0,π/2] cos(x) dx = 1"
+    ),
+    'exp': (
+        math.exp,
+        0, 1,
+        math.e - 1,
+        "∫[0,1] e^x dx = e - 1"
+    ),
+    'sqrt': (
+        math.sqrt,
+        0, 4,
+        16/3,
+        "∫[0,4] √x dx = 16/3"
+    ),
+    '1_over_x': (
+        lambda x: 1/x if x != 0 else float('inf'),
+        1, 2,
+        math.log(2),
+        "∫[1,2] 1/x dx = ln(2)"
+    ),
+    '1_over_1_plus_x2': (
+        lambda x: 1 / (1 + x**2),
+        0, 1,
+        math.pi / 4,
+        "∫[0,1] 1/(1+x²) dx = π/4"
+    ),
+}
+
+# Reverse lookup used by compare_methods: test function -> name
+_TEST_FUNCTION_NAMES = {entry[0]: name for name, entry in _TEST_FUNCTIONS.items()}
+
+
 def get_common_test_functions() -> dict:
     """
     Get a dictionary of common test functions with their exact integrals.
     
     Returns:
         Dictionary mapping function names to tuples of (function, a, b, exact_value)
+        (a new dict on each call; the functions themselves are created once)
     """
-    return {
-        'polynomial_x2': (
-            lambda x: x**2,
-            0, 1,
-            1/3,
-            "∫[0,1] x² dx = 1/3"
-        ),
-        'polynomial_x3': (
-            lambda x: x**3,
-            0, 2,
-            4,
-            "∫[0,2] x³ dx = 4"
-        ),
-        'sin': (
-            math.sin,
-            0, math.pi,
-            2,
-            "∫[0,π] sin(x) dx = 2"
-        ),
-        'cos': (
-            math.cos,
-            0, math.pi/2,
-            1,
-            "∫[0,π/2] cos(x) dx = 1"
-        ),
-        'exp': (
-            math.exp,
-            0, 1,
-            math.e - 1,
-            "∫[0,1] e^x dx = e - 1"
-        ),
-        'sqrt': (
-            math.sqrt,
-            0, 4,
-            16/3,
-            "∫[0,4] √x dx = 16/3"
-        ),
-        '1_over_x': (
-            lambda x: 1/x if x != 0 else float('inf'),
-            1, 2,
-            math.log(2),
-            "∫[1,2] 1/x dx = ln(2)"
-        ),
-        '1_over_1_plus_x2': (
-            lambda x: 1 / (1 + x**2),
-            0, 1,
-            math.pi / 4,
-            "∫[0,1] 1/(1+x²) dx = π/4"
-        ),
-    }
+    return dict(_TEST_FUNCTIONS)
 
 
+@lru_cache(maxsize=32)
 def select_optimal_n(method: str, desired_accuracy: float = 1e-6) -> int:
     """
     Suggest an optimal value of n for a given method and desired accuracy.
+    Cached per (method, desired_accuracy).
     
     Parameters:
         method: 'trapezoidal', 'simpson_1/3', or 'simpson_3/8'
@@ -185,17 +245,25 @@ def select_optimal_n(method: str, desired_accuracy: float = 1e-6) -> int:
     if method == 'trapezoidal':
         n = int(1 / math.sqrt(desired_accuracy))
     elif method == 'simpson_1/3':
-        n = int(1 / (desired_accuracy ** 0.25))
-        n = n + (n % 2)  # Make even
+        n = int(1 / math.sqrt(math.sqrt(desired_accuracy)))  # accuracy ** -1/4
+        n += n % 2  # Make even
     elif method == 'simpson_3/8':
-        n = int(1 / (desired_accuracy ** 0.25))
-        n = n + (3 - n % 3) % 3  # Make divisible by 3
+        n = int(1 / math.sqrt(math.sqrt(desired_accuracy)))  # accuracy ** -1/4
+        n += -n % 3  # Make divisible by 3
     else:
         raise ValueError(f"Unknown method: {method}")
     
     return max(n, 10)  # At least 10 intervals
 
 
+@lru_cache(maxsize=16)
+def _format_specs(precision: int) -> Tuple[str, str]:
+    """
+    Fixed-point and exponent format specs for a precision, built once per precision.
+    """
+    return f".{precision}f", f".{precision}e"
+
+
 def format_result(result: dict, precision: int = 10) -> str:
     """
     Format integration result as a readable string.
@@ -210,38 +278,51 @@ def format_result(result: dict, precision: int = 10) -> str:
     if 'error' in result and isinstance(result['error'], str):
         return f"Error: {result['error']}"
     
+    fixed, exponent = _format_specs(precision)
+    
     output = []
     output.append(f"Method: {result.get('method', 'Unknown')}")
-    output.append(f"Result: {result.get('result', 'N/A'):.{precision}f}")
+    output.append(f"Result: {format(result.get('result', 'N/A'), fixed)}")
     output.append(f"Interval: [{result.get('a', 'N/A')}, {result.get('b', 'N/A')}]")
     output.append(f"Number of intervals (n): {result.get('n', 'N/A')}")
-    output.append(f"Step size (h): {result.get('h', 'N/A'):.{precision}f}")
+    output.append(f"Step size (h): {format(result.get('h', 'N/A'), fixed)}")
     output.append(f"Function evaluations: {result.get('function_evaluations', 'N/A')}")
     
     if 'error_bound' in result:
-        output.append(f"Error bound: {result['error_bound']:.{precision}e}")
+        output.append(f"Error bound: {format(result['error_bound'], exponent)}")
     
     return '\n'.join(output)
 
 
-def calculate_error_metrics(approximate: float, exact: float) -> dict:
+def calculate_error_metrics(approximate, exact) -> dict:
     """
     Calculate various error metrics.
     
+    Scalars give float metrics; arrays (e.g. the results of several methods
+    against one exact value) give arrays of metrics, computed in one vectorized
+    pass instead of one call per value.
+    
     Parameters:
-        approximate: Approximate value
-        exact: Exact value
+        approximate: Approximate value(s)
+        exact: Exact value(s), broadcast against approximate
     
     Returns:
         Dictionary with error metrics
     """
-    absolute_error = abs(approximate - exact)
-    relative_error = absolute_error / abs(exact) if exact != 0 else float('inf')
-    percentage_error = relative_error * 100
+    approximate = np.asarray(approximate, dtype=np.float64)
+    exact = np.asarray(exact, dtype=np.float64)
+    
+    absolute_error = np.abs(approximate - exact)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        relative_error = np.where(exact != 0, absolute_error / np.abs(exact), np.inf)
+        significant_digits = np.where(relative_error > 0, -np.log10(relative_error), np.inf)
     
-    return {
+    metrics = {
         'absolute_error': absolute_error,
         'relative_error': relative_error,
-        'percentage_error': percentage_error,
-        'significant_digits': -math.log10(relative_error) if relative_error > 0 else float('inf')
+        'percentage_error': relative_error * 100,
+        'significant_digits': significant_digits
     }
+    if absolute_error.ndim == 0:
+        return {key: float(value) for key, value in metrics.items()}
+    return metrics
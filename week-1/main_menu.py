@@ -2,22 +2,27 @@ import tkinter as tk
 from tkinter import messagebox
 import subprocess
 import os
+import sys
 
-ASSIGNMENTS = {
+PYTHON = sys.executable
+# New console window per assignment (the flag only exists on Windows)
+CREATION_FLAGS = subprocess.CREATE_NEW_CONSOLE if os.name == 'nt' else 0
+
+_ASSIGNMENT_PATHS = {
     'Assignment 1 (Nonlinear Equations)': r'week-1/assignment-1/main.py',
     'Assignment 2 (Linear Systems)': r'week-1/assignment-2/main.py',
     'Assignment 3 (Approximation)': r'week-1/assignment-3/main.py',
     'Assignment 4.1 (Finite Differences)': r'week-1/assignment-4/part-1/main.py',
 }
+ASSIGNMENTS = {name: os.path.abspath(path) for name, path in _ASSIGNMENT_PATHS.items()}
 
 
-def run_assignment(path):
-    abs_path = os.path.abspath(path)
+def run_assignment(abs_path):
     if not os.path.exists(abs_path):
         messagebox.showerror('Error', f'File not found: {abs_path}')
         return
     try:
-        subprocess.Popen(['python', abs_path], creationflags=subprocess.CREATE_NEW_CONSOLE)
+        subprocess.Popen([PYTHON, abs_path], creationflags=CREATION_FLAGS)
     except Exception as e:
         messagebox.showerror('Error', str(e))
 